@@ -1,12 +1,48 @@
+import mmap
 import os
+import pickle
+import random
 import re
+import shutil
+import tempfile
 import time
-from datetime import datetime
-from typing import List, Set
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
-import arxiv
+import feedparser
+import requests
 
 DEFAULT_ARXIV_QUERY = 'all:"VLA" OR all:"Vision-Language-Action"'
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+# Atom XML 压缩率很高，显式请求 gzip；requests 会自动解压
+ARXIV_REQUEST_HEADERS = {
+	"Accept-Encoding": "gzip",
+	"User-Agent": "daily-arxiv-vla/arxiv-crawler (+https://arxiv.org)",
+}
+# 匹配 arxiv.org/abs/ 后面的 arXiv ID 及版本号，用于去掉版本号
+_NORM_RE = re.compile(r"(arxiv\.org/abs/(\d+\.\d+))v\d+", re.IGNORECASE)
+# 提取 arxiv.org/abs/ 后的 arXiv ID（不含版本号），去重时只比较 ID
+_ID_RE = re.compile(r"arxiv\.org/abs/([\w\-\.\/]+?)(?:v\d+)?(?![\w\-\.\/])", re.IGNORECASE)
+# 扫描 papers.md 用的 bytes 版本：arXiv 链接是纯 ASCII，无需解码 UTF-8
+_ID_RE_B = re.compile(rb"https?://arxiv\.org/abs/([\w\-\.\/]+?)(?:v\d+)?(?![\w\-\.\/])", re.IGNORECASE)
+
+
+@dataclass
+class ArxivEntry:
+	"""
+	/**
+	 * @class ArxivEntry
+	 * @description arXiv Atom 结果的轻量记录，只保留写入 `papers.md` 所需的字段。
+	 */
+	"""
+
+	entry_id: str
+	title: str
+	published: Optional[datetime]
+	primary_category: str
 
 
 class ArxivCollector:
@@ -29,6 +65,11 @@ class ArxivCollector:
 		"cs.RO",
 	}
 
+	# 标题写入表格前的转义：`|` 会破坏列分隔，换行会截断表格行
+	_TITLE_TRANS = str.maketrans({"|": "\\|", "\n": " ", "\r": " "})
+	# 简要总结列的默认折叠占位
+	_DEFAULT_SUMMARY_CELL = "<details><summary>展开</summary>待生成</details>"
+
 	def __init__(self, papers_path: str, init_results: int = None, daily_results: int = None, query_keyword: str = None):
 		"""
 		初始化 ArxivCollector
@@ -38,65 +79,183 @@ class ArxivCollector:
 		- ARXIV_DAILY_RESULTS: 每日抓取数量（默认 20）
 		- ARXIV_PAGE_SIZE: 单次请求返回数量（默认 20，避免 arxiv 库默认请求 100 条触发限流）
 		- ARXIV_DELAY_SECONDS: arXiv 请求间隔（默认 10 秒）
+		- ARXIV_CONCURRENCY: 同时在途的分页请求数（默认 1，arXiv 官方建议单连接访问）
+		- ARXIV_EARLY_EXIT: 设为 1 时每日增量在第一页论文均已收录时跳过其余分页（默认 0，始终抓满整个窗口）
 		"""
 		self.papers_path = papers_path
+		# 去重索引旁路文件：pickle 序列化的 arXiv ID frozenset，比 papers.md 新时直接读取，避免重新扫描 Markdown
+		self.index_path = os.path.splitext(papers_path)[0] + ".idx"
 		self.init_results = init_results or int(os.getenv("ARXIV_INIT_RESULTS", "500"))
 		self.daily_results = daily_results or int(os.getenv("ARXIV_DAILY_RESULTS", "20"))
 		self.query_keyword = query_keyword or os.getenv("ARXIV_QUERY_KEYWORD") or DEFAULT_ARXIV_QUERY
 		self.arxiv_page_size = int(os.getenv("ARXIV_PAGE_SIZE", "20"))
 		self.arxiv_delay_seconds = float(os.getenv("ARXIV_DELAY_SECONDS", "10"))
+		self.arxiv_concurrency = max(1, int(os.getenv("ARXIV_CONCURRENCY", "1")))
+		# 按提交时间排序时，延迟公布或暂缓审核的论文可能排在后面的分页，默认不提前结束
+		self.arxiv_early_exit = os.getenv("ARXIV_EARLY_EXIT", "0") == "1"
+		# 已存在论文 ID 的缓存，首次扫描 papers.md 后复用，写入新行时增量更新
+		self._existing_cache: Optional[Set[str]] = None
+		# 表头确认过一次后，同一实例内不再重复检查文件
+		self._header_ensured = False
 
-	def _search(self, max_results: int) -> List[arxiv.Result]:
+	def invalidate(self) -> None:
+		"""
+		/**
+		 * 丢弃实例上的缓存（表头检查结果与已存在论文 ID），
+		 * 用于 `papers.md` 被其他程序修改之后继续复用同一实例。
+		 */
 		"""
-		搜索 arXiv 论文，带重试机制
+		self._existing_cache = None
+		self._header_ensured = False
+
+	def _parse_entry(self, entry: feedparser.FeedParserDict) -> ArxivEntry:
+		"""
+		/**
+		 * @private 将 feedparser 条目转换为 ArxivEntry。
+		 */
+		"""
+		published_parsed = entry.get("published_parsed")
+		published = datetime(*published_parsed[:6], tzinfo=timezone.utc) if published_parsed else None
+		primary_category = entry.get("arxiv_primary_category") or {}
+		return ArxivEntry(
+			entry_id=entry.get("id", ""),
+			title=" ".join(entry.get("title", "").split()),
+			published=published,
+			primary_category=primary_category.get("term", ""),
+		)
+
+	def _build_query(self) -> str:
+		"""
+		/**
+		 * @private 在关键词查询上附加 `cat:` 约束，让 arXiv 只返回允许类目的论文。
+		 * `cat:` 也会命中交叉列表的论文，因此仍需 `_filter_categories` 按主类目复核。
+		 */
+		"""
+		categories = " OR ".join(f"cat:{c}" for c in sorted(self._ALLOWED_PRIMARY_CATEGORIES))
+		return f"({self.query_keyword}) AND ({categories})"
+
+	def _fetch_page(self, session: requests.Session, page_index: int, start: int, size: int) -> List[ArxivEntry]:
+		"""
+		/**
+		 * @private 抓取单个分页，带重试机制。
+		 * 除第一批并发请求外，每个分页在发出前先等待 ARXIV_DELAY_SECONDS，保持对 arXiv 的访问频率。
+		 */
 		"""
 		max_retries = int(os.getenv("ARXIV_MAX_RETRIES", "3"))
 		retry_base_seconds = float(os.getenv("ARXIV_RETRY_BASE_SECONDS", "30"))
-		page_size = max(1, min(max_results, self.arxiv_page_size))
-		client = arxiv.Client(
-			page_size=page_size,
-			delay_seconds=self.arxiv_delay_seconds,
-			num_retries=0,
-		)
+		params = {
+			"search_query": self._build_query(),
+			"sortBy": "submittedDate",
+			"sortOrder": "descending",
+			"start": start,
+			"max_results": size,
+		}
+
+		if page_index >= self.arxiv_concurrency:
+			time.sleep(self.arxiv_delay_seconds)
 
 		for attempt in range(max_retries):
 			try:
-				search = arxiv.Search(
-					query=self.query_keyword,
-					max_results=max_results,
-					sort_by=arxiv.SortCriterion.SubmittedDate,
-					sort_order=arxiv.SortOrder.Descending,
-				)
-				return list(client.results(search))
-			except Exception as e:
+				resp = session.get(ARXIV_API_URL, params=params, timeout=int(os.getenv("HTTP_TIMEOUT", "30")))
+				resp.raise_for_status()
+				feed = feedparser.parse(resp.content)
+				return [self._parse_entry(entry) for entry in feed.entries]
+			except requests.exceptions.RequestException as e:
 				if attempt < max_retries - 1:
-					wait_seconds = retry_base_seconds * (2 ** attempt)
+					# 指数退避叠加随机抖动，避免并发分页在同一时刻集中重试
+					wait_seconds = retry_base_seconds * (2 ** attempt) + random.uniform(0, retry_base_seconds)
 					print(
-						f"arXiv搜索失败，等待 {wait_seconds:.0f} 秒后重试 "
+						f"arXiv分页 start={start} 抓取失败，等待 {wait_seconds:.0f} 秒后重试 "
 						f"{attempt + 1}/{max_retries}: {repr(e)}"
 					)
 					time.sleep(wait_seconds)
 				else:
+					raise
+
+		return []
+
+	def _search(self, max_results: int, existing: Optional[Set[str]] = None) -> List[ArxivEntry]:
+		"""
+		搜索 arXiv 论文：直接请求 Atom API，按分页并发抓取，带重试机制。
+		任一分页最终失败则整体返回空列表，与此前的行为保持一致。
+		分页按顺序调度，同时在途的请求不超过 arxiv_concurrency 个；某页返回不足 size 条说明结果已取尽，不再调度后续分页。
+		传入 existing 时先单独抓取第一页：若其中（允许类目内的）论文非空且均已收录，视为上次运行后没有新论文，
+		直接跳过其余分页；第一页没有允许类目的论文时无法判断，照常抓取其余分页。
+		"""
+		page_size = max(1, min(max_results, self.arxiv_page_size))
+		pages: List[Tuple[int, int]] = [
+			(start, min(page_size, max_results - start)) for start in range(0, max_results, page_size)
+		]
+		if not pages:
+			return []
+
+		results: List[ArxivEntry] = []
+		with requests.Session() as session:
+			session.headers.update(ARXIV_REQUEST_HEADERS)
+			next_page_index = 0
+			if existing is not None:
+				try:
+					first_page = self._fetch_page(session, 0, *pages[0])
+				except Exception as e:
 					print(f"arXiv搜索失败，已达最大重试次数: {repr(e)}")
 					return []
+				# 主类目不在允许范围内的论文从不写入 papers.md，不参与判断
+				allowed = self._filter_categories(first_page)
+				if allowed and all(self._extract_arxiv_id(r.entry_id) in existing for r in allowed):
+					print("arXiv 第一页论文均已收录，跳过其余分页")
+					return first_page
+				results.extend(first_page)
+				next_page_index = 1
+				if len(first_page) < pages[0][1]:
+					return results
+			if next_page_index >= len(pages):
+				return results
 
-		return []
+			remaining = iter(list(enumerate(pages))[next_page_index:])
+			executor = ThreadPoolExecutor(max_workers=min(self.arxiv_concurrency, len(pages) - next_page_index))
+			in_flight: Deque[Tuple[int, Future]] = deque()
+
+			def submit_next() -> None:
+				page = next(remaining, None)
+				if page is not None:
+					page_index, (start, size) = page
+					in_flight.append((size, executor.submit(self._fetch_page, session, page_index, start, size)))
+
+			try:
+				for _ in range(self.arxiv_concurrency):
+					submit_next()
+				while in_flight:
+					size, future = in_flight.popleft()
+					entries = future.result()
+					results.extend(entries)
+					if len(entries) < size:
+						break
+					submit_next()
+			except Exception as e:
+				print(f"arXiv搜索失败，已达最大重试次数: {repr(e)}")
+				return []
+			finally:
+				# 提前结束或出错时取消尚未开始的分页，不等待在途请求的重试
+				executor.shutdown(wait=False, cancel_futures=True)
+
+		return results
 
-	def _filter_categories(self, results: List[arxiv.Result]) -> List[arxiv.Result]:
+	def _filter_categories(self, results: List[ArxivEntry]) -> List[ArxivEntry]:
 		"""
 		/**
-		 * @private 过滤到指定主类目
-		 * @param {List[Result]} results - 原始结果
-		 * @returns {List[Result]} 过滤后的结果
+		 * @private 过滤到指定主类目（查询已带 `cat:` 约束，这里只做主类目复核）
+		 * @param {List[ArxivEntry]} results - 原始结果
+		 * @returns {List[ArxivEntry]} 过滤后的结果
 		 */
 		"""
-		filtered: List[arxiv.Result] = []
+		filtered: List[ArxivEntry] = []
 		for r in results:
 			if r.primary_category in self._ALLOWED_PRIMARY_CATEGORIES:
 				filtered.append(r)
 		return filtered
 
-	def _normalize_link(self, link: str) -> str:
+	@staticmethod
+	def _normalize_link(link: str) -> str:
 		"""
 		/**
 		 * @private 规范化 arXiv 链接，去掉版本号（如 v1, v2, v3）。
@@ -106,18 +265,44 @@ class ArxivCollector:
 		"""
 		# 先去掉首尾空格
 		link = link.strip()
-		# 匹配 arxiv.org/abs/ 后面的 arXiv ID 格式，去掉版本号部分
+		# 快速路径：绝大多数链接形如 .../abs/2510.09607v2，直接用字符串切分去掉版本号
+		head, _, tail = link.rpartition("/")
+		stem, vsep, ver = tail.rpartition("v")
+		if tail and not vsep:
+			return link
+		year_month, dot, number = stem.partition(".")
+		if (
+			ver.isdigit()
+			and dot
+			and year_month.isdigit()
+			and number.isdigit()
+			and head.lower().endswith("arxiv.org/abs")
+		):
+			return f"{head}/{stem}"
+		# 其余情况回退到正则：匹配 arxiv.org/abs/ 后面的 arXiv ID 格式，去掉版本号部分
 		# 例如：http://arxiv.org/abs/2510.09607v2 -> http://arxiv.org/abs/2510.09607
 		# 只处理包含 arxiv.org/abs/ 的链接，避免误匹配其他数字格式
-		return re.sub(r"(arxiv\.org/abs/(\d+\.\d+))v\d+", r"\1", link, flags=re.IGNORECASE).strip()
+		return _NORM_RE.sub(r"\1", link).strip()
+
+	@staticmethod
+	def _extract_arxiv_id(link: str) -> str:
+		"""
+		/**
+		 * @private 从 arXiv 链接中提取不含版本号的 ID，作为去重键。
+		 * @param {str} link - 原始链接，如 http://arxiv.org/abs/2510.09607v2
+		 * @returns {str} arXiv ID，如 2510.09607；无法识别时返回规范化后的链接
+		 */
+		"""
+		m = _ID_RE.search(link)
+		return m.group(1) if m else ArxivCollector._normalize_link(link)
 
 	def _default_summary_cell(self) -> str:
 		"""
 		/**
-		 * @private 返回简要总结列的默认折叠占位。
+		 * @private 返回简要总结列的默认折叠占位（保留以兼容旧调用，热路径直接使用 `_DEFAULT_SUMMARY_CELL`）。
 		 */
 		"""
-		return "<details><summary>展开</summary>待生成</details>"
+		return self._DEFAULT_SUMMARY_CELL
 
 	def _ensure_md_header(self) -> None:
 		"""
@@ -125,74 +310,140 @@ class ArxivCollector:
 		 * 确保 `papers.md` 存在且包含四列表头。
 		 */
 		"""
+		if self._header_ensured:
+			return
 		four_header = "| 日期 | 标题 | 链接 | 简要总结 |\n"
 		four_sep = "| --- | --- | --- | --- |\n"
-		if not os.path.exists(self.papers_path):
+		if not os.path.exists(self.papers_path) or os.path.getsize(self.papers_path) == 0:
 			with open(self.papers_path, "w", encoding="utf-8") as f:
 				f.write(four_header)
 				f.write(four_sep)
+		self._header_ensured = True
+
+	def _index_sidecar_fresh(self) -> bool:
+		"""
+		/**
+		 * @private 判断去重索引旁路文件是否存在且不旧于 papers.md。
+		 */
+		"""
+		try:
+			return os.stat(self.index_path).st_mtime_ns >= os.stat(self.papers_path).st_mtime_ns
+		except OSError:
+			return False
+
+	def _write_index_sidecar(self, ids: Set[str]) -> None:
+		"""
+		/**
+		 * @private 重写去重索引旁路文件，失败时仅打印警告（下次运行会重新扫描 papers.md）。
+		 */
+		"""
+		try:
+			with open(self.index_path, "wb") as f:
+				pickle.dump(frozenset(ids), f, protocol=5)
+		except Exception as e:
+			print(f"警告: 写入去重索引失败: {repr(e)}")
 
 	def _load_existing_links(self) -> Set[str]:
 		"""
 		解析 papers.md 已有的 arXiv 链接集合，用于去重。
-		返回规范化后的链接（去掉版本号）。
+		返回不含版本号的 arXiv ID（如 2510.09607）。
+		结果缓存在实例上，同一实例重复调用不会再次扫描文件。
+		旁路索引文件比 papers.md 新时直接读取；否则扫描 papers.md 并重写旁路索引。
 		"""
+		if self._existing_cache is not None:
+			return self._existing_cache
+
 		if not os.path.exists(self.papers_path):
 			return set()
 
+		if self._index_sidecar_fresh():
+			try:
+				with open(self.index_path, "rb") as f:
+					self._existing_cache = set(pickle.load(f))
+				return self._existing_cache
+			except Exception as e:
+				print(f"警告: 读取去重索引失败，改为扫描 papers.md: {repr(e)}")
+
 		links: Set[str] = set()
-		link_pattern = re.compile(r"https?://arxiv\.org/abs/[\w\-\.\/]+", re.IGNORECASE)
 
 		try:
-			with open(self.papers_path, "r", encoding="utf-8") as f:
-				for line in f:
-					for m in link_pattern.findall(line):
-						normalized = self._normalize_link(m)
-						links.add(normalized)
+			with open(self.papers_path, "rb") as f:
+				if os.fstat(f.fileno()).st_size > 0:
+					# 直接在内存映射上整体扫描，省去逐行迭代与 UTF-8 解码
+					with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+						for m in _ID_RE_B.finditer(mm):
+							links.add(m.group(1).decode("ascii"))
 		except Exception as e:
 			print(f"警告: 读取 papers.md 失败: {repr(e)}")
 			return set()
 
+		self._existing_cache = links
+		self._write_index_sidecar(links)
 		return links
 
-	def _format_row(self, r: arxiv.Result) -> str:
+	def _format_row(self, r: ArxivEntry) -> str:
 		"""
 		/**
 		 * 将单条结果格式化为 Markdown 表格行（四列）。
-		 * @param {Result} r - 论文结果
+		 * @param {ArxivEntry} r - 论文结果
 		 * @returns {str} 形如 `| 2025-09-26 | 标题 | https://arxiv.org/abs/xxxx | <details>..</details> |`
 		 */
 		"""
 		date_str = r.published.strftime("%Y-%m-%d") if isinstance(r.published, datetime) else ""
-		title = (r.title or "").replace("|", "\\|").strip()
+		title = (r.title or "").translate(self._TITLE_TRANS).strip()
 		# 规范化链接，去掉版本号
 		link = self._normalize_link(r.entry_id)
-		summary_cell = self._default_summary_cell()
+		summary_cell = self._DEFAULT_SUMMARY_CELL
 		return f"| {date_str} | {title} | {link} | {summary_cell} |\n"
 
-	def _append_rows(self, rows: List[str]) -> None:
+	def _format_new_rows(self, results: List[ArxivEntry], existing: Set[str]) -> List[str]:
 		"""
-		将若干行插入到表头之后（保持最新内容靠前）。
+		/**
+		 * 按 arXiv ID 过滤掉已收录的论文，并格式化剩余结果。
+		 * 同一批结果中重复出现的 ID 只保留第一次出现的条目（结果按提交时间倒序，即最新的一条）。
+		 * @returns {List[str]} 待写入的表格行
+		 */
 		"""
-		self._ensure_md_header()
-
-		try:
-			with open(self.papers_path, "r", encoding="utf-8") as f:
-				lines = f.readlines()
-		except Exception as e:
-			print(f"错误: 读取 papers.md 失败: {repr(e)}")
-			raise
+		candidates: Dict[str, ArxivEntry] = {}
+		for r in results:
+			arxiv_id = self._extract_arxiv_id(r.entry_id)
+			if arxiv_id not in existing and arxiv_id not in candidates:
+				candidates[arxiv_id] = r
+		return [self._format_row(r) for r in candidates.values()]
 
-		insert_idx = 2 if len(lines) >= 2 else len(lines)
-		new_lines = lines[:insert_idx] + rows + lines[insert_idx:]
+	def _append_blob(self, blob: bytes) -> None:
+		"""
+		将已拼接好的若干行（UTF-8 编码）插入到表头之后（保持最新内容靠前）。
+		只读取两行表头，其余内容按块流式复制到同目录临时文件，再原子替换原文件。
+		"""
+		self._ensure_md_header()
 
+		papers_dir = os.path.dirname(os.path.abspath(self.papers_path))
+		tmp_path = None
 		try:
-			with open(self.papers_path, "w", encoding="utf-8") as f:
-				f.writelines(new_lines)
+			with open(self.papers_path, "rb") as src:
+				header = src.readline() + src.readline()
+				with tempfile.NamedTemporaryFile(
+					"wb", buffering=1 << 20, dir=papers_dir, prefix=".papers.", suffix=".tmp", delete=False
+				) as tmp:
+					tmp_path = tmp.name
+					tmp.write(header + blob)
+					shutil.copyfileobj(src, tmp, length=1 << 20)
+					# 替换前整体落盘一次，保证 os.replace 之后的文件内容完整
+					tmp.flush()
+					os.fsync(tmp.fileno())
+			shutil.copymode(self.papers_path, tmp_path)
+			os.replace(tmp_path, self.papers_path)
 		except Exception as e:
+			if tmp_path and os.path.exists(tmp_path):
+				os.remove(tmp_path)
 			print(f"错误: 写入 papers.md 失败: {repr(e)}")
 			raise
 
+		if self._existing_cache is not None:
+			self._existing_cache.update(m.group(1).decode("ascii") for m in _ID_RE_B.finditer(blob))
+			self._write_index_sidecar(self._existing_cache)
+
 	def initialize(self) -> int:
 		"""
 		/**
@@ -200,18 +451,17 @@ class ArxivCollector:
 		 * @returns {int} 写入的论文数量
 		 */
 		"""
+		papers_size = os.path.getsize(self.papers_path) if os.path.exists(self.papers_path) else 0
 		self._ensure_md_header()
-		existing = self._load_existing_links()
+		if papers_size == 0:
+			# 冷启动：文件此前不存在或为空，无需再扫描刚写入的表头
+			existing = self._existing_cache = set()
+		else:
+			existing = self._load_existing_links()
 		results = self._filter_categories(self._search(self.init_results))
-		rows: List[str] = []
-		for r in results:
-			# 使用规范化链接进行去重比较
-			normalized_link = self._normalize_link(r.entry_id)
-			if normalized_link in existing:
-				continue
-			rows.append(self._format_row(r))
+		rows = self._format_new_rows(results, existing)
 		if rows:
-			self._append_rows(rows)
+			self._append_blob("".join(rows).encode("utf-8"))
 		return len(rows)
 
 	def run_daily(self) -> int:
@@ -223,16 +473,11 @@ class ArxivCollector:
 		"""
 		self._ensure_md_header()
 		existing = self._load_existing_links()
-		results = self._filter_categories(self._search(self.daily_results))
-		rows: List[str] = []
-		for r in results:
-			# 使用规范化链接进行去重比较
-			normalized_link = self._normalize_link(r.entry_id)
-			if normalized_link in existing:
-				continue
-			rows.append(self._format_row(r))
+		# 只有显式开启 ARXIV_EARLY_EXIT 时才允许按第一页提前结束，否则抓满 ARXIV_DAILY_RESULTS 窗口
+		results = self._filter_categories(self._search(self.daily_results, existing if self.arxiv_early_exit else None))
+		rows = self._format_new_rows(results, existing)
 		if rows:
-			self._append_rows(rows)
+			self._append_blob("".join(rows).encode("utf-8"))
 		return len(rows)
 
 
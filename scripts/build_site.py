@@ -17,9 +17,12 @@ import os
 import re
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from html import escape
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, TypedDict
 
 try:
     from PIL import Image
@@ -27,6 +30,12 @@ try:
 except ImportError:
     HAS_PIL = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 INPUT_MD = PROJECT_ROOT / "papers.md"
@@ -38,6 +47,7 @@ IMAGE_DIR = ASSETS_DIR / "paper-images"
 PAPER_IMAGES_MANIFEST = ASSETS_DIR / "paper-images.json"
 DEFAULT_ARXIV_QUERY = 'all:"VLA" OR all:"Vision-Language-Action"'
 DEFAULT_ARXIV_KEYWORD_LABEL = "VLA / Vision-Language-Action"
+PARALLEL_BUILD_MIN_RECORDS = 64
 
 COVER_THEMES = [
     {
@@ -115,6 +125,58 @@ SECTION_TITLE_ALIASES = {
 }
 
 
+@dataclass
+class PaperRecord:
+    # 每行一条记录，数量随 papers.md 增长；固定字段用 __slots__ 省去每个实例的 __dict__
+    __slots__ = ("date", "title", "link", "details_raw")
+
+    date: str
+    title: str
+    link: str
+    details_raw: str
+
+
+class SummarySection(TypedDict):
+    title: str
+    markdown: str
+    html: str
+    plain_text: str
+    bullets: List[str]
+
+
+# 摘要文本解析与渲染用到的正则，按记录/按行调用频繁，统一在模块加载时编译
+# 表格行：前三列不含 |，最后一列（摘要）可能内嵌 |；用 [^\S\n] 代替 \s，避免跨行匹配
+_RE_ROW = re.compile(
+    r"^[^\S\n]*\|+[^\S\n]*([^|\n]*?)[^\S\n]*\|[^\S\n]*([^|\n]*?)[^\S\n]*\|[^\S\n]*([^|\n]*?)[^\S\n]*\|(.*)",
+    re.MULTILINE,
+)
+_RE_DETAILS = re.compile(r"<details>([\s\S]*?)</details>", re.IGNORECASE)
+_RE_SUMMARY = re.compile(r"<summary>[\s\S]*?</summary>", re.IGNORECASE)
+_RE_BR = re.compile(r"<br\s*/?\s*>", re.IGNORECASE)
+
+_RE_HEADING_BREAK = re.compile(r"([^\n\s#])\s*(?=#+\s)")
+_RE_HR = re.compile(r"\s*---\s*")
+_RE_HR_INLINE = re.compile(r"([^\n])\s*---\s*([^\n])")
+_RE_LIST_DASH = re.compile(r"\s+[-–]\s+")
+_RE_OL = re.compile(r"(?<!\n)(?<!\*\*)(\s*)(\d+\.\s+)")
+_RE_BOLD_SECTION = re.compile(r"\s+-\s+\*\*(.+?)\*\*")
+_RE_CN_HEADING = re.compile(r"([。！？；])\s*(#+\s+)")
+_RE_BLANKS = re.compile(r"\n{3,}")
+
+_RE_CODE = re.compile(r"`([^`]+)`")
+_RE_BOLD = re.compile(r"\*\*([^*]+)\*\*")
+_RE_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+# 行内代码 / 粗体 / 链接合并为一个交替模式，一次扫描完成行内渲染
+_RE_INLINE = re.compile(r"`([^`]+)`|\*\*([^*]+)\*\*|\[([^\]]+)\]\(([^)]+)\)")
+_RE_MD_HEADING = re.compile(r"^(#{1,6})\s+(.+)$")
+_RE_MD_BULLET = re.compile(r"^[-*]\s+")
+_RE_MD_ORDERED = re.compile(r"^\d+\.\s+")
+_RE_HTML_TAG = re.compile(r"<[^>]+>")
+_RE_PLAIN_HEADING = re.compile(r"^#{1,6}\s*", re.MULTILINE)
+_RE_PLAIN_BULLET = re.compile(r"^\s*[-*]\s+", re.MULTILINE)
+_RE_PLAIN_ORDERED = re.compile(r"^\s*\d+\.\s+", re.MULTILINE)
+
+
 def read_text(path: Path) -> str:
     with path.open("r", encoding="utf-8") as file:
         return file.read()
@@ -126,6 +188,32 @@ def write_text(path: Path, content: str) -> None:
         file.write(content)
 
 
+def write_bytes(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+def write_if_changed(path: Path, content: str | bytes) -> None:
+    """内容与磁盘上的文件完全一致时跳过写入，避免无意义地刷新 mtime。"""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    write_bytes(path, data)
+
+
+def dump_site_json(data: object) -> bytes:
+    """序列化站点数据：默认输出紧凑 JSON，设置环境变量 DEBUG 时缩进便于查看。"""
+    indent = bool(os.getenv("DEBUG"))
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def load_json(path: Path) -> object:
     if not path.exists():
         return {}
@@ -142,141 +230,188 @@ def get_arxiv_keyword_label() -> str:
     return keyword
 
 
-def parse_markdown_table(md_text: str) -> List[Dict[str, str]]:
-    lines = [line for line in md_text.splitlines() if line.strip()]
-    if len(lines) < 3:
-        return []
-
-    records: List[Dict[str, str]] = []
-    for line in lines[2:]:
-        if not line.strip().startswith("|"):
-            continue
-
-        parts = [part.strip() for part in line.strip().strip("|").split("|")]
-        if len(parts) < 4:
+def parse_markdown_table(md_text: str) -> List[PaperRecord]:
+    # 跳过前两行非空行（表头与分隔行），其余部分交给 _RE_ROW 一次扫描
+    body_start = 0
+    skipped = 0
+    while skipped < 2:
+        line_end = md_text.find("\n", body_start)
+        if line_end == -1:
+            return []
+        if md_text[body_start:line_end].strip():
+            skipped += 1
+        body_start = line_end + 1
+
+    records: List[PaperRecord] = []
+    append_record = records.append
+    for match in _RE_ROW.finditer(md_text, body_start):
+        date_str, title, link, summary_cell = match.groups()
+        summary_cell = summary_cell.rstrip().rstrip("|")
+        # 日期为空的行格式有误，不生成记录
+        if not date_str or not summary_cell:
             continue
-
-        date_str, title, link = parts[0], parts[1], parts[2]
-        summary_cell = "|".join(parts[3:]).strip()
-        records.append(
-            {
-                "date": date_str,
-                "title": title,
-                "link": link,
-                "details_raw": extract_details(summary_cell),
-            }
+        if "|" in summary_cell:
+            summary_cell = "|".join(part.strip() for part in summary_cell.split("|"))
+        else:
+            summary_cell = summary_cell.strip()
+        append_record(
+            PaperRecord(
+                # 同一天的论文很多，日期字符串驻留后全表共享同一个对象
+                date=sys.intern(date_str),
+                title=title,
+                link=link,
+                details_raw=extract_details(summary_cell),
+            )
         )
 
     return records
 
 
-def extract_details(cell_html: str) -> str:
-    match = re.search(r"<details>([\s\S]*?)</details>", cell_html, re.IGNORECASE)
-    content = match.group(1) if match else cell_html
-    content = re.sub(r"<summary>[\s\S]*?</summary>", "", content, flags=re.IGNORECASE)
-    content = content.replace("<br>", "\n").replace("<br/>", "\n").replace("<br />", "\n")
-    return content.strip()
+def _cut_summaries(content: str, lowered: str) -> str:
+    pieces: List[str] = []
+    position = 0
+    while True:
+        start = lowered.find("<summary>", position)
+        if start == -1:
+            break
+        end = lowered.find("</summary>", start + 9)
+        if end == -1:
+            break
+        pieces.append(content[position:start])
+        position = end + 10
+    if not pieces:
+        return content
+    pieces.append(content[position:])
+    return "".join(pieces)
 
 
+def extract_details(cell_html: str) -> str:
+    # 用 str.find 线性定位 <details>/<summary>，不经过正则回溯；
+    # 标签大小写不敏感，但个别字符 lower() 后长度会变，此时下标无法对齐，退回正则
+    lowered = cell_html.lower()
+    if len(lowered) == len(cell_html):
+        content = cell_html
+        start = lowered.find("<details>")
+        if start != -1:
+            end = lowered.find("</details>", start + 9)
+            if end != -1:
+                content = cell_html[start + 9 : end]
+                lowered = lowered[start + 9 : end]
+        content = _cut_summaries(content, lowered)
+    else:
+        match = _RE_DETAILS.search(cell_html)
+        content = match.group(1) if match else cell_html
+        content = _RE_SUMMARY.sub("", content)
+    return _RE_BR.sub("\n", content).strip()
+
+
+@lru_cache(maxsize=4096)
 def auto_add_linebreaks(text: str) -> str:
+    # 尚未生成摘要的记录没有可修复的内容，直接跳过整串正则替换
+    if not text or text == "待生成":
+        return text
+
     fixed = text
     has_linebreaks = "\n" in fixed
 
     if has_linebreaks:
-        fixed = re.sub(r"([^\n\s#])\s*(?=#+\s)", r"\1\n", fixed)
-        fixed = re.sub(r"([^\n])\s*---\s*([^\n])", r"\1\n---\n\2", fixed)
-        fixed = re.sub(r"\n{3,}", "\n\n", fixed)
+        fixed = _RE_HEADING_BREAK.sub(r"\1\n", fixed)
+        fixed = _RE_HR_INLINE.sub(r"\1\n---\n\2", fixed)
+        fixed = _RE_BLANKS.sub("\n\n", fixed)
         return fixed.strip()
 
-    fixed = re.sub(r"([^\n\s#])\s*(?=#+\s)", r"\1\n", fixed)
-    fixed = re.sub(r"\s*---\s*", "\n---\n", fixed)
-    fixed = re.sub(r"\s+[-–]\s+", "\n- ", fixed)
-    fixed = re.sub(r"(?<!\n)(?<!\*\*)(\s*)(\d+\.\s+)", lambda m: "\n" + m.group(2), fixed)
-    fixed = re.sub(r"\s+-\s+\*\*(.+?)\*\*", lambda m: "\n- **" + m.group(1) + "**", fixed)
-    fixed = re.sub(r"([。！？；])\s*(#+\s+)", r"\1\n\2", fixed)
-    fixed = re.sub(r"\n{3,}", "\n\n", fixed)
+    fixed = _RE_HEADING_BREAK.sub(r"\1\n", fixed)
+    fixed = _RE_HR.sub("\n---\n", fixed)
+    fixed = _RE_LIST_DASH.sub("\n- ", fixed)
+    fixed = _RE_OL.sub(lambda m: "\n" + m.group(2), fixed)
+    fixed = _RE_BOLD_SECTION.sub(lambda m: "\n- **" + m.group(1) + "**", fixed)
+    fixed = _RE_CN_HEADING.sub(r"\1\n\2", fixed)
+    fixed = _RE_BLANKS.sub("\n\n", fixed)
     return fixed.strip()
 
 
+def _render_inline_match(match: re.Match[str]) -> str:
+    code, bold, link_text, link_url = match.groups()
+    if code is not None:
+        return f"<code>{code}</code>"
+    # 粗体与链接文字内部仍可能包含其他行内标记
+    if bold is not None:
+        return f"<strong>{render_inline(bold)}</strong>"
+    return f'<a href="{link_url}" target="_blank" rel="noopener noreferrer">{render_inline(link_text)}</a>'
+
+
+def render_inline(text: str) -> str:
+    return _RE_INLINE.sub(_render_inline_match, text)
+
+
+@lru_cache(maxsize=4096)
 def markdown_to_html(md: str) -> str:
     lines = md.splitlines()
     html_lines: List[str] = []
-
-    def render_inline(text: str) -> str:
-        text = re.sub(r"`([^`]+)`", r"<code>\1</code>", text)
-        text = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", text)
-        text = re.sub(
-            r"\[([^\]]+)\]\(([^)]+)\)",
-            r'<a href="\2" target="_blank" rel="noopener noreferrer">\1</a>',
-            text,
-        )
-        return text
+    append_line = html_lines.append
+    # 连续空行在主循环里直接合并为一个，开头的空行不输出
+    previous_blank = True
 
     index = 0
     while index < len(lines):
         line = lines[index].rstrip()
 
         if not line:
-            html_lines.append("")
+            if not previous_blank:
+                append_line("")
+                previous_blank = True
             index += 1
             continue
 
-        title_match = re.match(r"^(#{1,6})\s+(.+)$", line)
+        previous_blank = False
+
+        title_match = _RE_MD_HEADING.match(line)
         if title_match:
             level = min(len(title_match.group(1)), 4)
             title_text = title_match.group(2).strip()
-            html_lines.append(f"<h{level}>{render_inline(title_text)}</h{level}>")
+            append_line(f"<h{level}>{render_inline(title_text)}</h{level}>")
             index += 1
             continue
 
         if line.strip() == "---":
-            html_lines.append("<hr/>")
+            append_line("<hr/>")
             index += 1
             continue
 
-        if re.match(r"^[-*]\s+", line):
+        if _RE_MD_BULLET.match(line):
             items: List[str] = []
             while index < len(lines):
                 current = lines[index].rstrip()
                 if not current:
                     break
-                if re.match(r"^[-*]\s+", current):
-                    item_text = re.sub(r"^[-*]\s+", "", current).strip()
+                if _RE_MD_BULLET.match(current):
+                    item_text = _RE_MD_BULLET.sub("", current).strip()
                     items.append(f"<li>{render_inline(item_text)}</li>")
                     index += 1
                     continue
                 break
-            html_lines.append("<ul>" + "".join(items) + "</ul>")
+            append_line("<ul>" + "".join(items) + "</ul>")
             continue
 
-        if re.match(r"^\d+\.\s+", line):
+        if _RE_MD_ORDERED.match(line):
             items = []
             while index < len(lines):
                 current = lines[index].rstrip()
                 if not current:
                     break
-                if re.match(r"^\d+\.\s+", current):
-                    item_text = re.sub(r"^\d+\.\s+", "", current).strip()
+                if _RE_MD_ORDERED.match(current):
+                    item_text = _RE_MD_ORDERED.sub("", current).strip()
                     items.append(f"<li>{render_inline(item_text)}</li>")
                     index += 1
                     continue
                 break
-            html_lines.append("<ol>" + "".join(items) + "</ol>")
+            append_line("<ol>" + "".join(items) + "</ol>")
             continue
 
-        html_lines.append(f"<p>{render_inline(line)}</p>")
+        append_line(f"<p>{render_inline(line)}</p>")
         index += 1
 
-    collapsed: List[str] = []
-    previous_blank = False
-    for line in html_lines:
-        is_blank = line == ""
-        if is_blank and previous_blank:
-            continue
-        collapsed.append(line)
-        previous_blank = is_blank
-
-    return "\n".join(collapsed).strip()
+    return "\n".join(html_lines).strip()
 
 
 def normalize_section_title(title: str) -> str:
@@ -289,16 +424,24 @@ def normalize_section_title(title: str) -> str:
 
 
 def strip_markdown(text: str) -> str:
+    # 每个小节、每条要点都会调用一次：先用子串判断跳过不可能命中的替换
     plain = text
-    plain = re.sub(r"<[^>]+>", " ", plain)
-    plain = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"\1", plain)
-    plain = re.sub(r"`([^`]+)`", r"\1", plain)
-    plain = re.sub(r"\*\*([^*]+)\*\*", r"\1", plain)
-    plain = re.sub(r"^#{1,6}\s*", "", plain, flags=re.MULTILINE)
-    plain = re.sub(r"^\s*[-*]\s+", "", plain, flags=re.MULTILINE)
-    plain = re.sub(r"^\s*\d+\.\s+", "", plain, flags=re.MULTILINE)
-    plain = re.sub(r"\s+", " ", plain)
-    return plain.strip()
+    if "<" in plain:
+        plain = _RE_HTML_TAG.sub(" ", plain)
+    if "](" in plain:
+        plain = _RE_LINK.sub(r"\1", plain)
+    if "`" in plain:
+        plain = _RE_CODE.sub(r"\1", plain)
+    if "**" in plain:
+        plain = _RE_BOLD.sub(r"\1", plain)
+    if "#" in plain:
+        plain = _RE_PLAIN_HEADING.sub("", plain)
+    if "-" in plain or "*" in plain:
+        plain = _RE_PLAIN_BULLET.sub("", plain)
+    if "." in plain:
+        plain = _RE_PLAIN_ORDERED.sub("", plain)
+    # 与 re.sub(r"\s+", " ", ...).strip() 等价：str.split() 使用相同的 Unicode 空白定义
+    return " ".join(plain.split())
 
 
 def truncate_text(text: str, limit: int) -> str:
@@ -335,9 +478,9 @@ def extract_bullets(markdown: str) -> List[str]:
     return [sentence.strip() for sentence in sentences if sentence.strip()][:3]
 
 
-def parse_markdown_sections(markdown: str) -> List[Dict[str, str]]:
+def parse_markdown_sections(markdown: str) -> List[SummarySection]:
     lines = markdown.splitlines()
-    sections: List[Dict[str, str]] = []
+    sections: List[SummarySection] = []
     current_title = ""
     current_lines: List[str] = []
 
@@ -386,7 +529,7 @@ def parse_markdown_sections(markdown: str) -> List[Dict[str, str]]:
     ]
 
 
-def find_section(sections: List[Dict[str, str]], *keywords: str) -> Dict[str, str] | None:
+def find_section(sections: List[SummarySection], *keywords: str) -> SummarySection | None:
     for section in sections:
         title = section["title"]
         if any(keyword in title for keyword in keywords):
@@ -394,7 +537,7 @@ def find_section(sections: List[Dict[str, str]], *keywords: str) -> Dict[str, st
     return None
 
 
-def extract_research_unit(sections: List[Dict[str, str]]) -> str:
+def extract_research_unit(sections: List[SummarySection]) -> str:
     section = find_section(sections, "研究单位")
     if not section:
         return ""
@@ -406,7 +549,7 @@ def extract_research_unit(sections: List[Dict[str, str]]) -> str:
     return truncate_text(section["plain_text"], 52)
 
 
-def build_preview(sections: List[Dict[str, str]]) -> str:
+def build_preview(sections: List[SummarySection]) -> str:
     overview = find_section(sections, "论文概述", "摘要")
     if overview and overview["plain_text"]:
         return overview["plain_text"].strip()
@@ -418,7 +561,7 @@ def build_preview(sections: List[Dict[str, str]]) -> str:
     return "待生成"
 
 
-def build_key_points(sections: List[Dict[str, str]], preview_text: str) -> List[str]:
+def build_key_points(sections: List[SummarySection], preview_text: str) -> List[str]:
     preferred_sections = [
         find_section(sections, "论文概述", "摘要"),
         find_section(sections, "核心贡献"),
@@ -530,9 +673,10 @@ def theme_style(theme: Dict[str, str]) -> str:
 
 def render_note_cover(record: Dict[str, object], standalone: bool = False) -> str:
     compact_class = " note-cover-standalone" if standalone else ""
+    theme: Dict[str, str] = record["cover_theme"]  # type: ignore[assignment]
 
     return f"""
-<article class="note-cover note-cover-title-only{compact_class}" style="{escape(theme_style(record["cover_theme"]), quote=True)}">
+<article class="note-cover note-cover-title-only{compact_class}" style="{escape(theme_style(theme), quote=True)}">
   <div class="note-cover-mesh"></div>
   <div class="note-cover-title-shell">
     <h1 class="note-cover-title">{escape(str(record["title"]))}</h1>
@@ -554,7 +698,7 @@ def render_paper_figure(record: Dict[str, object], image_src: str, context: str)
 
 
 def render_detail_intro(record: Dict[str, object]) -> str:
-    point_items = "".join(f"<li>{escape(point)}</li>" for point in record["key_points"])  # type: ignore[index]
+    point_items = "".join(f"<li>{escape(point)}</li>" for point in record["key_points"])  # type: ignore[attr-defined, index]
     cover_link = f"../../covers/{record['page_dir']}/"
 
     return f"""
@@ -571,7 +715,7 @@ def render_detail_intro(record: Dict[str, object]) -> str:
 
 def render_detail_sections(record: Dict[str, object]) -> str:
     parts = [render_detail_intro(record)]
-    sections: List[Dict[str, str]] = record["sections"]  # type: ignore[assignment]
+    sections: List[SummarySection] = record["sections"]  # type: ignore[assignment]
 
     for index, section in enumerate(sections, start=1):
         parts.append(
@@ -590,46 +734,67 @@ def render_detail_sections(record: Dict[str, object]) -> str:
     return "\n".join(parts)
 
 
-def build_site_records(records: List[Dict[str, str]], paper_image_manifest: Dict[str, Dict[str, object]]) -> List[Dict[str, object]]:
-    built: List[Dict[str, object]] = []
+def build_site_record(record: PaperRecord, paper_image_manifest: Dict[str, Dict[str, object]]) -> Dict[str, object]:
+    summary_markdown = auto_add_linebreaks(record.details_raw)
+    sections = parse_markdown_sections(summary_markdown)
+    preview_text = build_preview(sections)
+    key_points = build_key_points(sections, preview_text)
+    hook_text = build_hook_text(key_points, preview_text)
+    arxiv_id = normalize_arxiv_id(record.link)
+    page_dir = make_page_dir_name(arxiv_id, record.title)
+    cover_theme = pick_cover_theme(arxiv_id or record.title)
+    reading_minutes = estimate_reading_minutes(summary_markdown)
+    research_unit = extract_research_unit(sections)
+    paper_image_path = get_paper_image_path(paper_image_manifest, arxiv_id)
 
-    for record in records:
-        summary_markdown = auto_add_linebreaks(record["details_raw"])
-        sections = parse_markdown_sections(summary_markdown)
-        preview_text = build_preview(sections)
-        key_points = build_key_points(sections, preview_text)
-        hook_text = build_hook_text(key_points, preview_text)
-        arxiv_id = normalize_arxiv_id(record["link"])
-        page_dir = make_page_dir_name(arxiv_id, record["title"])
-        cover_theme = pick_cover_theme(arxiv_id or record["title"])
-        reading_minutes = estimate_reading_minutes(summary_markdown)
-        research_unit = extract_research_unit(sections)
-        paper_image_path = get_paper_image_path(paper_image_manifest, arxiv_id)
+    return {
+        "date": record.date,
+        "title": record.title,
+        "link": record.link,
+        "arxiv_id": arxiv_id,
+        "page_dir": page_dir,
+        "detail_path": f"papers/{page_dir}/",
+        "cover_path": f"covers/{page_dir}/",
+        "paper_image_path": paper_image_path,
+        "translation_link": get_translation_link(record.link),
+        "summary_markdown": summary_markdown,
+        "sections": sections,
+        "preview_text": preview_text,
+        "research_unit": research_unit,
+        "key_points": key_points,
+        "hook_text": hook_text,
+        "reading_minutes": reading_minutes,
+        "section_count": len(sections),
+        "cover_theme": cover_theme,
+    }
 
-        built.append(
-            {
-                "date": record["date"],
-                "title": record["title"],
-                "link": record["link"],
-                "arxiv_id": arxiv_id,
-                "page_dir": page_dir,
-                "detail_path": f"papers/{page_dir}/",
-                "cover_path": f"covers/{page_dir}/",
-                "paper_image_path": paper_image_path,
-                "translation_link": get_translation_link(record["link"]),
-                "summary_markdown": summary_markdown,
-                "sections": sections,
-                "preview_text": preview_text,
-                "research_unit": research_unit,
-                "key_points": key_points,
-                "hook_text": hook_text,
-                "reading_minutes": reading_minutes,
-                "section_count": len(sections),
-                "cover_theme": cover_theme,
-            }
-        )
 
-    return built
+# 工作进程内的图片清单，由进程池 initializer 在每个进程启动时设置一次
+_worker_paper_image_manifest: Dict[str, Dict[str, object]] = {}
+
+
+def _init_build_worker(paper_image_manifest: Dict[str, Dict[str, object]]) -> None:
+    global _worker_paper_image_manifest
+    _worker_paper_image_manifest = paper_image_manifest
+
+
+def _build_site_record_in_worker(record: PaperRecord) -> Dict[str, object]:
+    return build_site_record(record, _worker_paper_image_manifest)
+
+
+def build_site_records(records: List[PaperRecord], paper_image_manifest: Dict[str, Dict[str, object]]) -> List[Dict[str, object]]:
+    workers = os.cpu_count() or 1
+    # 每条记录的解析/渲染互不依赖且是纯 CPU 的正则处理，记录较多时分发到多进程绕开 GIL；
+    # 记录较少或单核时进程启动开销得不偿失，保持串行
+    if workers <= 1 or len(records) < PARALLEL_BUILD_MIN_RECORDS:
+        return [build_site_record(record, paper_image_manifest) for record in records]
+
+    # 图片清单随 initargs 只向每个工作进程传一次，分块任务里只序列化记录本身
+    chunksize = max(1, len(records) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_build_worker, initargs=(paper_image_manifest,)
+    ) as executor:
+        return list(executor.map(_build_site_record_in_worker, records, chunksize=chunksize))
 
 
 def build_list_data(records: List[Dict[str, object]], thumb_map: Dict[str, str] | None = None) -> List[Dict[str, object]]:
@@ -3555,13 +3720,13 @@ def main() -> int:
     shutil.rmtree(PAPERS_DIR, ignore_errors=True)
     shutil.rmtree(COVERS_DIR, ignore_errors=True)
 
-    write_text(SITE_DIR / "index.html", generate_index_html())
-    write_text(ASSETS_DIR / "style.css", generate_style_css())
-    write_text(ASSETS_DIR / "theme.js", generate_theme_js())
-    write_text(ASSETS_DIR / "media.js", generate_media_js())
-    write_text(ASSETS_DIR / "app.js", generate_app_js())
-    write_text(ASSETS_DIR / "paper.js", generate_paper_js())
-    write_text(ASSETS_DIR / "data.json", json.dumps(list_data, ensure_ascii=False, indent=2))
+    write_if_changed(SITE_DIR / "index.html", generate_index_html())
+    write_if_changed(ASSETS_DIR / "style.css", generate_style_css())
+    write_if_changed(ASSETS_DIR / "theme.js", generate_theme_js())
+    write_if_changed(ASSETS_DIR / "media.js", generate_media_js())
+    write_if_changed(ASSETS_DIR / "app.js", generate_app_js())
+    write_if_changed(ASSETS_DIR / "paper.js", generate_paper_js())
+    write_if_changed(ASSETS_DIR / "data.json", dump_site_json(list_data))
 
     for idx, record in enumerate(site_records):
       prev_rec = site_records[idx - 1] if idx > 0 else None
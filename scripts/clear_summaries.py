@@ -9,6 +9,13 @@ import os
 import re
 from pathlib import Path
 
+# 恰好四个单元格的表格行；单元格内含 | 的行不匹配，保持原样
+_RE_ROW = re.compile(r"^[^\S\n]*\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|[^\S\n]*$", re.MULTILINE)
+_RE_DETAILS = re.compile(r"<details>([\s\S]*?)</details>", re.IGNORECASE)
+_RE_SUMMARY = re.compile(r"<summary>[\s\S]*?</summary>", re.IGNORECASE)
+_RE_BR = re.compile(r"<br\s*/?\s*>", re.IGNORECASE)
+_RE_H2 = re.compile(r"##\s+")
+
 
 def get_papers_md_path() -> str:
     """获取 papers.md 的绝对路径"""
@@ -17,19 +24,11 @@ def get_papers_md_path() -> str:
     return os.path.join(root_dir, "papers.md")
 
 
-def parse_table_line(line: str) -> list[str]:
-    """解析 markdown 表格行，返回单元格列表"""
-    parts = [p.strip() for p in line.strip().split("|")]
-    # 去除首尾空项（因为行首尾都有 `|`）
-    cells = [p for p in parts if p and p != "---"]
-    return cells
-
-
-def rebuild_line(date_str: str, title: str, link: str, summary_html: str) -> str:
-    """将四列内容重建为表格行"""
-    safe_title = title.replace("|", "\\|")
-    safe_summary = summary_html.replace("|", "\\|")
-    return f"| {date_str} | {safe_title} | {link} | {safe_summary} |\n"
+def _replace_last_cell(line: str, new_cell: str) -> str:
+    """只替换表格行的最后一个单元格，其余单元格原样保留"""
+    trailing_pipe = line.rfind("|")
+    cell_start = line.rfind("|", 0, trailing_pipe) + 1
+    return f"{line[:cell_start]} {new_cell} {line[trailing_pipe:]}"
 
 
 def default_summary_cell() -> str:
@@ -42,20 +41,23 @@ def is_valid_markdown_format(summary_cell: str) -> bool:
     检查摘要是否遵循正确的 Markdown 格式
     要求：必须包含 ## 二级标题
     """
+    # 没有 <details> 标签时无需进入正则
+    if "<details>" not in summary_cell.lower():
+        return False
+
     # 提取 <details> 内容
-    match = re.search(r"<details>([\s\S]*?)</details>", summary_cell, re.IGNORECASE)
+    match = _RE_DETAILS.search(summary_cell)
     if not match:
         return False
 
     content = match.group(1)
     # 去掉 <summary>...</summary>
-    content = re.sub(r"<summary>[\s\S]*?</summary>", "", content, flags=re.IGNORECASE)
+    content = _RE_SUMMARY.sub("", content)
     # 将 <br> 转换回换行
-    content = content.replace("<br>", "\n").replace("<br/>", "\n").replace("<br />", "\n")
-    content = content.strip()
+    content = _RE_BR.sub("\n", content).strip()
 
     # 检查是否包含 ## 标题（至少要有一个）
-    if not re.search(r"##\s+", content):
+    if "##" not in content or not _RE_H2.search(content):
         return False
 
     return True
@@ -68,49 +70,39 @@ def clear_all_summaries() -> int:
         raise FileNotFoundError(f"未找到 {papers_md}")
 
     with open(papers_md, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+        text = f.read()
 
-    if len(lines) < 2:
+    # 前两行为表头与分隔行，原样保留
+    first_break = text.find("\n")
+    if first_break == -1 or first_break == len(text) - 1:
         return 0
-
-    header = lines[:2]
-    body = lines[2:]
+    second_break = text.find("\n", first_break + 1)
+    body_start = len(text) if second_break == -1 else second_break + 1
 
     cleared_count = 0
-    new_body = []
-
-    for line in body:
-        if not line.strip().startswith("|"):
-            new_body.append(line)
-            continue
-
-        cells = parse_table_line(line)
-        if len(cells) != 4:
-            new_body.append(line)
-            continue
-
-        date_str, title, link, summary_cell = cells
-
-        # 检查是否是"待生成"占位符
-        if "待生成" in summary_cell:
-            new_body.append(line)
-            continue
-
-        # 检查是否符合 Markdown 格式
-        if not is_valid_markdown_format(summary_cell):
-            # 不符合格式，替换为默认占位符
-            new_summary_cell = default_summary_cell()
-            new_line = rebuild_line(date_str, title, link, new_summary_cell)
-            new_body.append(new_line)
-            cleared_count += 1
-            print(f"清除不符合格式的摘要: {title[:50]}...")
-        else:
-            # 符合格式，保持不变
-            new_body.append(line)
-
-    # 写回文件
+
+    def maybe_clear(match: re.Match) -> str:
+        nonlocal cleared_count
+        cells = [cell.strip() for cell in match.groups()]
+        if not all(cells) or "---" in cells:
+            return match.group(0)
+
+        title, summary_cell = cells[1], cells[3]
+
+        # 检查是否是"待生成"占位符，或已符合 Markdown 格式
+        if "待生成" in summary_cell or is_valid_markdown_format(summary_cell):
+            return match.group(0)
+
+        # 不符合格式，替换为默认占位符
+        cleared_count += 1
+        print(f"清除不符合格式的摘要: {title[:50]}...")
+        return _replace_last_cell(match.group(0), default_summary_cell())
+
+    new_text = text[:body_start] + _RE_ROW.sub(maybe_clear, text[body_start:])
+
+    # 整体写回文件
     with open(papers_md, "w", encoding="utf-8") as f:
-        f.writelines(header + new_body)
+        f.write(new_text)
 
     return cleared_count
 
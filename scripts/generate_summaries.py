@@ -1,15 +1,120 @@
+import codecs
+import email.utils
+import hashlib
+import json
 import os
+import random
 import re
+import shutil
+import sqlite3
+import tempfile
+import threading
 import time
-from typing import List, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+import feedparser
 import requests
 from dotenv import load_dotenv
-from openai import OpenAI
 from tqdm import tqdm
 
+from clear_summaries import is_valid_markdown_format
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
 
 RATE_LIMITED_MODELS: Set[str] = set()
+HTTP_REQUEST_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "daily-arxiv-vla/summary-generator (+https://arxiv.org)",
+}
+SUMMARY_CACHE_FILENAME = "summaries.sqlite3"
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+# 抓取 HTML 时不再重试的客户端错误，以及按 Retry-After 等待后重试的限流/维护状态码（404 单独处理）
+NON_RETRYABLE_HTTP_STATUSES = frozenset({400, 401, 403, 410})
+THROTTLED_HTTP_STATUSES = frozenset({429, 503})
+MAX_RETRY_AFTER_SECONDS = 120.0
+# html: 读取 HTML 正文；abstract: 只用 arXiv API 返回的标题、作者与摘要；html_fallback_abstract: HTML 不可用时回退到摘要
+SUMMARY_MODES = ("html", "abstract", "html_fallback_abstract")
+# 各模式下生成摘要可能使用的输入来源，依次查缓存
+SUMMARY_MODE_SOURCES = {
+    "html": ("html",),
+    "abstract": ("abstract",),
+    "html_fallback_abstract": ("html", "abstract"),
+}
+# BATCH_LLM_SIZE > 1 时追加到系统提示词，要求模型按顺序返回 JSON 字符串数组
+BATCH_SYSTEM_PROMPT_SUFFIX = '''
+
+**批量输出要求：**
+本次提供 {count} 篇论文，每篇以 ### Paper i (arXiv ID) 开头。请按上述模板分别为每篇论文生成总结，
+只输出一个 JSON 对象：键为各篇论文标题行括号中的 arXiv ID（共 {count} 个：{ids}），
+值为该论文的 Markdown 总结字符串（换行写作 \\n），不要遗漏、合并或新增论文，不要输出其他内容。'''
+USER_PROMPT_PREFIXES = {
+    "html": "以下为从论文 HTML 页面提取的正文（已去除标签，可能已截断）：\n\n",
+    "abstract": (
+        "注意：本篇未提供 HTML 原文，以下只有论文的标题、作者、类目与摘要。请只依据这些信息总结，"
+        "摘要中没有的内容（如研究单位、数据集、训练资源、具体实验数值）写“摘要未提及”，不要推测：\n\n"
+    ),
+}
+SUMMARY_SYSTEM_PROMPT = '''你是一名论文阅读专家。根据提供的 arXiv 论文 HTML 原文，生成结构化的论文总结。
+
+**严格格式要求：**
+1. 必须使用标准 Markdown 格式
+2. 每个部分必须使用 ## 二级标题（例如：## 研究单位）
+3. 使用 **粗体** 强调关键信息（如机构名、模型名、数据集名）
+4. 使用无序列表（- 开头）组织要点
+5. 每个列表项简洁明了，一行一个要点
+6. 不要使用代码块标记（```）
+
+**输出模板（严格遵循）：**
+
+## 研究单位
+- 列出论文作者所属的研究机构
+
+## 论文概述
+- 用 2-3 个要点概括论文的核心内容和研究目标
+- 说明论文要解决的问题
+
+## 核心贡献
+- 贡献点 1
+- 贡献点 2
+- 贡献点 3
+（列出 3-5 个主要贡献）
+
+## 方法描述
+- 简要描述使用的技术方法
+- 说明创新点和关键技术
+
+## 数据集与资源
+- 使用的数据集名称
+- 模型规模和参数量
+- 训练资源（GPU/TPU 等）
+
+## 评估与结果
+- 评估环境和基准
+- 主要评估指标
+- 关键实验结果
+
+**注意：每个 ## 标题后必须换行，然后使用 - 开头的列表项。**'''
+
+# 模型输出后处理用到的正则，每篇论文都会调用，在模块加载时编译
+_RE_THINK = re.compile(r"<think>.*?</think>", re.IGNORECASE | re.DOTALL)
+_RE_FENCE_OPEN = re.compile(r"```markdown\s*", re.IGNORECASE)
+_RE_FENCE_CLOSE = re.compile(r"```\s*$", re.MULTILINE)
+# 一次扫描完成空白规范化：换行（连同其前的行尾空白）或行内连续空白
+_RE_WHITESPACE = re.compile(r"[ \t]*\n(?:[ \t]*\n)*|[ \t]+")
 
 
 """
@@ -21,9 +126,45 @@ RATE_LIMITED_MODELS: Set[str] = set()
 """
 
 
-def get_client() -> OpenAI:
+class ModelScopeClient:
+    """
+    /**
+     * @class ModelScopeClient
+     * @description 直接调用 OpenAI 兼容的 `/chat/completions` 接口（流式 SSE），
+     * 只读取增量文本并用 orjson 解析，省去 OpenAI SDK 对每个响应分片的 pydantic 校验与多层封装。
+     * 请求走与抓取 HTML 相同的共享 HTTP 会话。
+     */
+    """
+
+    def __init__(self, api_key: str, base_url: str):
+        self.url = base_url.rstrip("/") + "/chat/completions"
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            # 流式响应不压缩，增量内容到达即可读取
+            "Accept-Encoding": "identity",
+        }
+        self.timeout = (10, float(os.getenv("API_TIMEOUT", "120")))
+
+    def create_completion(self, model: str, messages: List[Dict[str, str]]) -> str:
+        """
+        /**
+         * @function create_completion
+         * @description 以流式方式请求一次 chat completion，返回拼接后的回复文本。
+         * 读超时按分片计算，生成中途卡住时能及时中断。HTTP 错误与流中的 error 事件抛出 RuntimeError，
+         * 消息包含状态码与响应内容，便于调用方识别配额/限流错误。
+         */
+        """
+        payload = dumps_json({"model": model, "messages": messages, "stream": True})
+        with get_http_session().post(self.url, data=payload, headers=self.headers, stream=True, timeout=self.timeout) as resp:
+            if resp.status_code >= 400:
+                raise RuntimeError(f"Error code: {resp.status_code} - {resp.text[:500]}")
+            return collect_stream_text(resp.iter_lines())
+
+
+def get_client() -> ModelScopeClient:
     """
-    构造 OpenAI 客户端（ModelScope），从环境变量读取配置。
+    构造 ModelScope 推理接口客户端，从环境变量读取配置。
     """
     load_dotenv()
     api_key = os.getenv("MODELSCOPE_ACCESS_TOKEN")
@@ -31,7 +172,7 @@ def get_client() -> OpenAI:
         raise RuntimeError("缺少环境变量 MODELSCOPE_ACCESS_TOKEN")
 
     base_url = os.getenv("MODELSCOPE_BASE_URL", "https://api-inference.modelscope.cn/v1/")
-    return OpenAI(api_key=api_key, base_url=base_url)
+    return ModelScopeClient(api_key=api_key, base_url=base_url)
 
 
 def get_papers_md_path() -> str:
@@ -46,6 +187,80 @@ def get_papers_md_path() -> str:
     return os.path.join(root_dir, "papers.md")
 
 
+def get_summary_cache_dir() -> str:
+    """
+    /**
+     * @function get_summary_cache_dir
+     * @description 摘要缓存目录，默认项目根目录下的 `.summary_cache`，可用环境变量 SUMMARY_CACHE_DIR 覆盖。
+     */
+    """
+    custom_dir = os.getenv("SUMMARY_CACHE_DIR")
+    if custom_dir:
+        return custom_dir
+    return os.path.join(os.path.dirname(get_papers_md_path()), ".summary_cache")
+
+
+class SummaryCache:
+    """
+    /**
+     * @class SummaryCache
+     * @description 基于 SQLite 的本地键值缓存：保存 (模型, 链接) -> 摘要，以及可选的 链接 -> HTML 原文。
+     * 写回 papers.md 失败、运行中断或更换模型重跑时，已生成过的摘要不必再次抓取和调用模型。
+     * 多个工作线程共享同一连接，读写由锁串行化。
+     */
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn.commit()
+
+    @staticmethod
+    def summary_key(model: str, link: str, source: str = "html") -> str:
+        # 基于 HTML 正文的摘要沿用原有键，基于其他来源的摘要单独存放，切换模式后不会串用
+        raw_key = f"{model}|{link}" if source == "html" else f"{model}|{link}|{source}"
+        return "summary:" + hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def html_key(link: str) -> str:
+        return "html:" + hashlib.sha1(link.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", (key, value))
+            self._conn.commit()
+
+
+_summary_cache: Optional[SummaryCache] = None
+_summary_cache_failed = False
+_summary_cache_lock = threading.Lock()
+
+
+def get_summary_cache() -> Optional[SummaryCache]:
+    """
+    获取进程内共享的摘要缓存；设置 SUMMARY_CACHE=0 时禁用，缓存无法打开时打印警告并禁用。
+    """
+    global _summary_cache, _summary_cache_failed
+    if os.getenv("SUMMARY_CACHE", "1") == "0":
+        return None
+    with _summary_cache_lock:
+        if _summary_cache is None and not _summary_cache_failed:
+            try:
+                _summary_cache = SummaryCache(os.path.join(get_summary_cache_dir(), SUMMARY_CACHE_FILENAME))
+            except (OSError, sqlite3.Error) as e:
+                print(f"警告: 摘要缓存不可用，本次不使用缓存: {repr(e)}")
+                _summary_cache_failed = True
+        return _summary_cache
+
+
 def is_placeholder_summary(cell: str) -> bool:
     """
     /**
@@ -56,18 +271,22 @@ def is_placeholder_summary(cell: str) -> bool:
     return "待生成" in cell
 
 
-def parse_table_line(line: str) -> List[str]:
+def parse_table_line(line: str) -> Optional[Tuple[str, str, str, str]]:
     """
     /**
      * @function parse_table_line
-     * @description 解析 markdown 表格行，返回去除空项后的单元格列表。
+     * @description 解析四列 markdown 表格行；调用方需先确认该行以 `|` 开头。
+     * 最多切分 5 次，单元格为空或多于四列（末尾 `|` 之后还有内容）时视为格式不符。
      * @param {str} line - 形如 `| a | b | c | d |\n`
-     * @returns {List[str]} 单元格列表
+     * @returns {Optional[Tuple[str,str,str,str]]} (日期, 标题, 链接, 简要总结)；格式不符时为 None
      */
     """
-    parts = [p.strip() for p in line.strip().split("|")]
-    # 去除首尾空项（因为行首尾都有 `|`）
-    cells = [p for p in parts if p and p != "---"]
+    parts = line.split("|", 5)
+    if len(parts) < 6 or parts[5].strip():
+        return None
+    cells = (parts[1].strip(), parts[2].strip(), parts[3].strip(), parts[4].strip())
+    if not all(cells):
+        return None
     return cells
 
 
@@ -117,57 +336,533 @@ def get_available_model_list(model: str = None) -> List[str]:
     return [candidate for candidate in get_model_list() if candidate not in RATE_LIMITED_MODELS]
 
 
-def generate_summary_for_link(client: OpenAI, link: str, model: str = None) -> str:
+class ArxivTextExtractor(HTMLParser):
     """
-    抓取 arXiv HTML 原文并让模型基于 HTML 生成简要总结。
-    包含模型回退机制和重试机制。
+    /**
+     * @class ArxivTextExtractor
+     * @description 从 arXiv HTML 页面提取正文纯文本：跳过脚本、样式、导航等与内容无关的节点，
+     * 块级元素边界转为换行；页面存在 <article> 时只保留其中的文本。
+     */
     """
-    # 获取模型列表，跳过本次运行中已经判定为限流的模型。
-    model_list = get_available_model_list(model)
-    if not model_list:
-        print(f"✗ 所有模型都已被判定为限流，跳过摘要生成: {link}")
+
+    SKIPPED_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "svg", "button", "annotation", "annotation-xml"}
+    BLOCK_TAGS = {
+        "p", "div", "section", "article", "main", "br", "li", "ul", "ol", "table", "tr",
+        "h1", "h2", "h3", "h4", "h5", "h6", "figure", "figcaption", "blockquote", "pre", "dt", "dd",
+    }
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.skip_depth = 0
+        self.article_depth = 0
+        self.page_parts: List[str] = []
+        self.article_parts: List[str] = []
+
+    def _append(self, text: str) -> None:
+        self.page_parts.append(text)
+        if self.article_depth > 0:
+            self.article_parts.append(text)
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in self.SKIPPED_TAGS:
+            self.skip_depth += 1
+            return
+        if tag == "article":
+            self.article_depth += 1
+        if self.skip_depth:
+            return
+        if tag in self.BLOCK_TAGS:
+            self._append("\n")
+        elif tag in ("td", "th"):
+            self._append(" ")
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "br" and not self.skip_depth:
+            self._append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self.SKIPPED_TAGS:
+            if self.skip_depth > 0:
+                self.skip_depth -= 1
+            return
+        if tag in self.BLOCK_TAGS and not self.skip_depth:
+            self._append("\n")
+        if tag == "article" and self.article_depth > 0:
+            self.article_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self.skip_depth:
+            self._append(data)
+
+    def get_text(self) -> str:
+        parts = self.article_parts if "".join(self.article_parts).strip() else self.page_parts
+        lines = (" ".join(line.split()) for line in "".join(parts).splitlines())
+        return "\n".join(line for line in lines if line)
+
+
+def html_to_text(html_content: str) -> str:
+    """
+    将 arXiv HTML 原文转为正文纯文本，去掉标签、脚本与样式，显著减少送入模型的 token。
+    """
+    extractor = ArxivTextExtractor()
+    extractor.feed(html_content)
+    extractor.close()
+    return extractor.get_text()
+
+
+def stream_html_to_text(resp: requests.Response, keep_html: bool = False) -> Tuple[str, Optional[str]]:
+    """
+    /**
+     * @function stream_html_to_text
+     * @description 边下载边解析：按块增量解码响应字节并喂给 ArxivTextExtractor，
+     * 解析与网络传输重叠，也不必先在内存中拼出完整的 HTML 字符串。
+     * @param {bool} keep_html - 为 True 时同时保留 HTML 原文（供 HTML_CACHE 使用）
+     * @returns {Tuple[str, Optional[str]]} (正文纯文本, HTML 原文或 None)
+     */
+    """
+    decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+    extractor = ArxivTextExtractor()
+    html_parts: Optional[List[str]] = [] if keep_html else None
+    for chunk in resp.iter_content(chunk_size=64 * 1024):
+        piece = decoder.decode(chunk)
+        extractor.feed(piece)
+        if html_parts is not None:
+            html_parts.append(piece)
+    piece = decoder.decode(b"", final=True)
+    extractor.feed(piece)
+    extractor.close()
+    if html_parts is None:
+        return extractor.get_text(), None
+    html_parts.append(piece)
+    return extractor.get_text(), "".join(html_parts)
+
+
+def thread_safe_singleton(func):
+    """
+    /**
+     * @function thread_safe_singleton
+     * @description 无参函数的进程内单例：首次调用在锁内构造并缓存结果。
+     * 单用 lru_cache 时，多个工作线程同时首次调用会各自构造一份（各自的限流令牌桶、会话，重复下载词表）。
+     */
+    """
+    cached = lru_cache(maxsize=1)(func)
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper():
+        with lock:
+            return cached()
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@thread_safe_singleton
+def get_http_session() -> requests.Session:
+    """
+    进程内共享的 HTTP 会话：复用到 arxiv.org 与推理接口的 keep-alive 连接，避免每篇论文重新握手 TCP/TLS。
+    每个主机的连接池大小与摘要并发数一致；重试由 generate_summary_for_link 自行处理，适配器层不重试。
+    """
+    pool_size = max(1, int(os.getenv("SUMMARY_CONCURRENCY", "1")))
+    # 会访问 arxiv.org、export.arxiv.org 与推理接口等多个主机，按主机各保留一个连接池
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HTTP_REQUEST_HEADERS)
+    return session
+
+
+@thread_safe_singleton
+def get_token_encoding():
+    """
+    加载用于估算输入长度的 tokenizer（cl100k_base）；未安装 tiktoken 或词表下载失败时返回 None。
+    各模型自身的 tokenizer 不尽相同，但按 token 计数远比按字符数接近真实上下文占用。
+    """
+    if not HAS_TIKTOKEN:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"警告: tokenizer 加载失败，仅按 HTML_MAX_CHARS 截断: {repr(e)}")
+        return None
+
+
+def truncate_to_token_budget(text: str, max_tokens: int) -> str:
+    """
+    按 token 数截断文本；max_tokens <= 0 或 tokenizer 不可用时原样返回。
+    """
+    encoding = get_token_encoding() if max_tokens > 0 else None
+    if encoding is None:
+        return text
+    token_ids = encoding.encode(text, disallowed_special=())
+    if len(token_ids) <= max_tokens:
+        return text
+    return encoding.decode(token_ids[:max_tokens])
+
+
+def retry_wait_seconds(attempt: int) -> float:
+    """
+    第 attempt 次失败后的等待时间：指数退避叠加随机抖动（上限 30 秒），
+    避免并发处理的多篇论文在同一时刻集中重试。
+    """
+    return min(2 ** attempt + random.uniform(0, 1), 30.0)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    估算文本的 token 数，用于每分钟 token 配额限流；tokenizer 不可用时按约 4 个字符一个 token 粗略估计。
+    """
+    encoding = get_token_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+class TokenBucket:
+    """
+    /**
+     * @class TokenBucket
+     * @description 线程安全的令牌桶：容量为每分钟配额，按配额/60 的速率匀速补充。
+     * 令牌不足时先预支（余额可为负）再在锁外等待，多个线程按调用顺序依次放行。
+     */
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.fill_rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> None:
+        # 单次请求超过整桶容量时按整桶计，否则永远等不到
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.fill_rate)
+            self.updated_at = now
+            self.tokens -= amount
+            wait_seconds = -self.tokens / self.fill_rate if self.tokens < 0 else 0.0
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
+@thread_safe_singleton
+def get_rate_limiters() -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+    """
+    /**
+     * @function get_rate_limiters
+     * @description 按 MODELSCOPE_RPM（每分钟请求数）与 MODELSCOPE_TPM（每分钟输入 token 数）构造进程内共享的限流器，
+     * 未配置或配置为 0 时对应限流器为 None（不限流）。
+     * @returns {Tuple[Optional[TokenBucket], Optional[TokenBucket]]} (请求数限流器, token 数限流器)
+     */
+    """
+    rpm = float(os.getenv("MODELSCOPE_RPM", "0"))
+    tpm = float(os.getenv("MODELSCOPE_TPM", "0"))
+    return (TokenBucket(rpm) if rpm > 0 else None, TokenBucket(tpm) if tpm > 0 else None)
+
+
+def retry_after_seconds(response: requests.Response, attempt: int) -> float:
+    """
+    /**
+     * @function retry_after_seconds
+     * @description 429/503 响应的等待时间：优先使用 Retry-After（秒数或 HTTP 日期），
+     * 缺失或无法解析时退回指数退避；上限 MAX_RETRY_AFTER_SECONDS。
+     */
+    """
+    retry_after = response.headers.get("Retry-After", "").strip()
+    if retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+    if retry_after:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+            return min(max(retry_at.timestamp() - time.time(), 0.0), MAX_RETRY_AFTER_SECONDS)
+        except (TypeError, ValueError):
+            pass
+    return retry_wait_seconds(attempt)
+
+
+def dumps_json(data: object) -> bytes:
+    """序列化请求体，安装了 orjson 时优先使用。"""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data: Union[str, bytes]):
+    """解析 JSON 字节串，安装了 orjson 时优先使用。"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def collect_stream_text(lines: Iterable[bytes]) -> str:
+    """
+    /**
+     * @function collect_stream_text
+     * @description 解析 SSE 流（`data: {...}` 行，以 `data: [DONE]` 结束），拼接 chat completion 的增量内容；
+     * 跳过不含 choices 的分片（如用量统计）与思考过程增量，流中出现 error 事件时抛出 RuntimeError。
+     */
+    """
+    pieces: List[str] = []
+    for line in lines:
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        event = loads_json(data)
+        if event.get("error"):
+            raise RuntimeError(f"API stream error: {event['error']}")
+        choices = event.get("choices")
+        if not choices:
+            continue
+        content = (choices[0].get("delta") or {}).get("content")
+        if content:
+            pieces.append(content)
+    return "".join(pieces)
+
+
+def _normalize_whitespace_match(match: "re.Match[str]") -> str:
+    """
+    /**
+     * @function _normalize_whitespace_match
+     * @description `_RE_WHITESPACE` 的替换函数：行内空白压缩为单个空格，去掉行尾空白，
+     * 连续三个及以上换行（含仅有空白的行）压缩为一个空行。
+     */
+    """
+    newlines = match.group(0).count("\n")
+    if newlines == 0:
+        return " "
+    return "\n\n" if newlines >= 3 else "\n" * newlines
+
+
+def clean_summary_text(text: str) -> str:
+    """
+    清洗模型输出：去掉思考内容与代码块标记，规范空白，并把换行转换为 <br> 以便存入 Markdown 表格。
+    """
+    text = text.strip()
+    # 移除模型可能输出的 <think>...</think> 思考内容
+    text = _RE_THINK.sub("", text).strip()
+    # 移除 Markdown 代码块标记
+    text = _RE_FENCE_OPEN.sub("", text)
+    text = _RE_FENCE_CLOSE.sub("", text)
+    text = text.strip()
+    # 规范化换行：保留换行符，但规范化空白
+    text = _RE_WHITESPACE.sub(_normalize_whitespace_match, text)
+    # 将换行符转换为 <br> 标签以便在 Markdown 表格中存储
+    return text.replace("\n", "<br>")
+
+
+def get_summary_mode() -> str:
+    """
+    读取 SUMMARY_MODE（html / abstract / html_fallback_abstract，默认 html），无法识别时打印警告并按 html 处理。
+    """
+    mode = os.getenv("SUMMARY_MODE", "html").strip().lower()
+    if mode not in SUMMARY_MODES:
+        print(f"警告: 无法识别的 SUMMARY_MODE={mode}，按 html 处理")
+        return "html"
+    return mode
+
+
+def arxiv_id_from_link(link: str) -> str:
+    """从 `http://arxiv.org/abs/2509.21243v1` 形式的链接中取出 arXiv ID（含版本号）。"""
+    return link.rstrip("/").rsplit("/abs/", 1)[-1]
+
+
+def fetch_arxiv_abstract(link: str) -> str:
+    """
+    /**
+     * @function fetch_arxiv_abstract
+     * @description 通过 arXiv Atom API 按 id 查询论文的标题、作者、类目与摘要（响应仅数 KB），
+     * 拼成供模型阅读的纯文本；失败时返回空字符串。
+     */
+    """
+    arxiv_id = arxiv_id_from_link(link)
+    max_retries = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+    timeout = int(os.getenv("HTTP_TIMEOUT", "30"))
+
+    for attempt in range(max_retries):
+        try:
+            resp = get_http_session().get(ARXIV_API_URL, params={"id_list": arxiv_id}, timeout=timeout)
+            resp.raise_for_status()
+            feed = feedparser.parse(resp.content)
+            break
+        except requests.exceptions.RequestException as e:
+            if attempt < max_retries - 1:
+                print(f"arXiv API 请求失败，重试 {attempt + 1}/{max_retries}: {link}")
+                time.sleep(retry_wait_seconds(attempt))
+            else:
+                print(f"arXiv API 请求失败: {link}: {repr(e)}")
+                return ""
+    else:
+        return ""
+
+    if not feed.entries or not feed.entries[0].get("summary"):
+        print(f"警告: arXiv API 未返回摘要: {link}")
         return ""
 
+    entry = feed.entries[0]
+    parts = [f"标题: {' '.join(entry.get('title', '').split())}"]
+    authors = ", ".join(author.get("name", "") for author in entry.get("authors", []))
+    if authors:
+        parts.append(f"作者: {authors}")
+    categories = ", ".join(tag.get("term", "") for tag in entry.get("tags", []))
+    if categories:
+        parts.append(f"类目: {categories}")
+    parts.append(f"\n摘要:\n{' '.join(entry.summary.split())}")
+    return "\n".join(parts)
+
+
+def fetch_html_paper_text(link: str, cache: Optional[SummaryCache]) -> str:
+    """
+    /**
+     * @function fetch_html_paper_text
+     * @description 抓取论文的 arXiv HTML 页面（带重试，可选 HTML 缓存）并提取正文纯文本；失败时返回空字符串。
+     */
+    """
     # 将 /abs/ 链接转换为 /html/ 页面
-    html_url = re.sub(r"/abs/", "/html/", link)
+    html_url = link.replace("/abs/", "/html/")
 
     # 抓取 HTML 文本（带重试）
     max_retries = int(os.getenv("HTTP_MAX_RETRIES", "3"))
     timeout = int(os.getenv("HTTP_TIMEOUT", "30"))
     html_content = None
-
-    for attempt in range(max_retries):
+    paper_text = ""
+    # HTML_CACHE=1 时同时缓存 HTML 原文，换模型重新生成摘要时无需再次抓取
+    html_cache = cache if os.getenv("HTML_CACHE", "0") == "1" else None
+    if html_cache is not None:
+        html_content = html_cache.get(SummaryCache.html_key(link))
+    if html_content:
+        paper_text = html_to_text(html_content)
+
+    for attempt in range(0 if html_content else max_retries):
         try:
-            resp = requests.get(html_url, timeout=timeout)
-            resp.raise_for_status()
-            html_content = resp.text
+            # 只把正文文本交给模型：HTML 标签、脚本和样式占了原文的大半，却不提供内容
+            with get_http_session().get(html_url, timeout=timeout, stream=True) as resp:
+                resp.raise_for_status()
+                paper_text, html_content = stream_html_to_text(resp, keep_html=html_cache is not None)
+            if html_cache is not None and html_content:
+                html_cache.set(SummaryCache.html_key(link), html_content)
             break
         except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                print(f"警告: HTML页面不存在，尝试使用PDF: {link}")
-                # 如果HTML不存在，尝试获取摘要（fallback）
+            status = e.response.status_code
+            if status == 404:
+                print(f"警告: HTML页面不存在: {link}")
+                return ""
+            elif status in NON_RETRYABLE_HTTP_STATUSES:
+                # 客户端错误重试也不会成功，直接放弃
+                print(f"HTTP错误 {status}，不再重试: {link}")
                 return ""
             elif attempt < max_retries - 1:
-                print(f"HTTP错误 {e.response.status_code}，重试 {attempt + 1}/{max_retries}: {link}")
-                time.sleep(2 ** attempt)
+                print(f"HTTP错误 {status}，重试 {attempt + 1}/{max_retries}: {link}")
+                if status in THROTTLED_HTTP_STATUSES:
+                    time.sleep(retry_after_seconds(e.response, attempt))
+                else:
+                    time.sleep(retry_wait_seconds(attempt))
             else:
                 print(f"HTTP请求失败，已达最大重试次数: {link}")
                 return ""
         except requests.exceptions.RequestException as e:
             if attempt < max_retries - 1:
                 print(f"网络错误，重试 {attempt + 1}/{max_retries}: {link}")
-                time.sleep(2 ** attempt)
+                time.sleep(retry_wait_seconds(attempt))
             else:
                 print(f"网络请求失败: {link}: {repr(e)}")
                 return ""
 
-    if not html_content:
+    if not paper_text:
+        print(f"警告: HTML页面未提取到正文: {link}")
         return ""
+    return paper_text
+
+
+def is_cacheable_summary(summary_text: str) -> bool:
+    """
+    /**
+     * @function is_cacheable_summary
+     * @description 只有 clear_summaries（## 标题）与 clean_summaries（“论文概述”）都会保留的摘要才写入或读取缓存；
+     * 否则清理脚本把该行重置为“待生成”后，下次运行会从缓存读回同样不合格的内容。
+     */
+    """
+    return "论文概述" in summary_text and is_valid_markdown_format(wrap_in_details(summary_text))
+
+
+def get_cached_summary(cache: Optional[SummaryCache], link: str, summary_mode: str, model: Optional[str] = None) -> str:
+    """
+    /**
+     * @function get_cached_summary
+     * @description 查找任一候选模型此前为该链接生成过的摘要（限流的模型也可复用其历史结果），未命中返回空字符串。
+     */
+    """
+    if cache is None:
+        return ""
+    for source in SUMMARY_MODE_SOURCES[summary_mode]:
+        for candidate in ([model] if model is not None else get_model_list()):
+            cached_text = cache.get(SummaryCache.summary_key(candidate, link, source))
+            # 旧版本可能缓存过格式不合格的摘要，读到时忽略，让该行重新生成
+            if cached_text and is_cacheable_summary(cached_text):
+                print(f"✓ 命中摘要缓存（模型 {candidate}）: {link}")
+                return cached_text
+    return ""
+
+
+def prepare_paper_text(link: str, summary_mode: str, cache: Optional[SummaryCache]) -> Tuple[str, str]:
+    """
+    /**
+     * @function prepare_paper_text
+     * @description 按 SUMMARY_MODE 获取送入模型的论文文本并按字符数、token 数截断。
+     * @returns {Tuple[str,str]} (论文文本, 来源 html/abstract)；获取失败时文本为空字符串
+     */
+    """
+    # 按 SUMMARY_MODE 选择输入：HTML 正文、arXiv API 返回的摘要，或 HTML 失败时回退到摘要
+    paper_text = ""
+    source = "html"
+    if summary_mode != "abstract":
+        paper_text = fetch_html_paper_text(link, cache)
+    if not paper_text and summary_mode != "html":
+        paper_text = fetch_arxiv_abstract(link)
+        source = "abstract"
+    if not paper_text:
+        return "", source
 
     # 按需截断，避免上下文过长
     max_chars = int(os.getenv("HTML_MAX_CHARS", "180000"))
-    if len(html_content) > max_chars:
-        html_content = html_content[:max_chars]
+    if len(paper_text) > max_chars:
+        paper_text = paper_text[:max_chars]
+    # 再按 token 数精确截断：中英文、公式密集程度不同，字符数与实际占用的上下文长度差别很大
+    paper_text = truncate_to_token_budget(paper_text, int(os.getenv("MAX_INPUT_TOKENS", "60000")))
+    return paper_text, source
+
+
+def acquire_rate_limit(system_prompt: str, user_content: str) -> None:
+    """
+    所有工作线程共享同一组令牌桶，并发时也不会超出服务商的每分钟配额。
+    """
+    request_limiter, token_limiter = get_rate_limiters()
+    if request_limiter is not None:
+        request_limiter.acquire()
+    if token_limiter is not None:
+        # 只有配置了 MODELSCOPE_TPM 才需要估算 token 数，避免无谓地再编码一遍正文
+        token_limiter.acquire(estimate_tokens(system_prompt) + estimate_tokens(user_content))
+
+
+def summarize_paper_text(
+    client: ModelScopeClient,
+    link: str,
+    paper_text: str,
+    source: str,
+    model_list: List[str],
+    cache: Optional[SummaryCache],
+) -> str:
+    """
+    /**
+     * @function summarize_paper_text
+     * @description 依次尝试模型列表中的模型为单篇论文生成摘要，包含模型回退与重试；全部失败时返回空字符串。
+     */
+    """
+    user_content = USER_PROMPT_PREFIXES[source] + paper_text
 
     # 遍历模型列表，依次尝试。单个模型最多调用两次：第二次仍失败则认为已被限流，直接切换下一个模型。
     api_max_retries = max(1, min(int(os.getenv("API_MAX_RETRIES", "3")), 2))
@@ -178,108 +873,40 @@ def generate_summary_for_link(client: OpenAI, link: str, model: str = None) -> s
         # 对当前模型进行重试
         for attempt in range(api_max_retries):
             try:
-                response = client.chat.completions.create(
+                acquire_rate_limit(SUMMARY_SYSTEM_PROMPT, user_content)
+                text = client.create_completion(
                     model=current_model,
                     messages=[
                         {
                             'role': 'system',
-                            'content': '''你是一名论文阅读专家。根据提供的 arXiv 论文 HTML 原文，生成结构化的论文总结。
-
-**严格格式要求：**
-1. 必须使用标准 Markdown 格式
-2. 每个部分必须使用 ## 二级标题（例如：## 研究单位）
-3. 使用 **粗体** 强调关键信息（如机构名、模型名、数据集名）
-4. 使用无序列表（- 开头）组织要点
-5. 每个列表项简洁明了，一行一个要点
-6. 不要使用代码块标记（```）
-
-**输出模板（严格遵循）：**
-
-## 研究单位
-- 列出论文作者所属的研究机构
-
-## 论文概述
-- 用 2-3 个要点概括论文的核心内容和研究目标
-- 说明论文要解决的问题
-
-## 核心贡献
-- 贡献点 1
-- 贡献点 2
-- 贡献点 3
-（列出 3-5 个主要贡献）
-
-## 方法描述
-- 简要描述使用的技术方法
-- 说明创新点和关键技术
-
-## 数据集与资源
-- 使用的数据集名称
-- 模型规模和参数量
-- 训练资源（GPU/TPU 等）
-
-## 评估与结果
-- 评估环境和基准
-- 主要评估指标
-- 关键实验结果
-
-**注意：每个 ## 标题后必须换行，然后使用 - 开头的列表项。**'''
+                            'content': SUMMARY_SYSTEM_PROMPT,
                         },
                         {
                             'role': 'user',
-                            'content': f"以下为论文的 HTML 原文（可能已截断）：\n\n{html_content}"
+                            'content': user_content,
                         },
                     ],
-                    stream=False,
                 )
-
-                if not response.choices:
-                    print(f"警告: API返回无choices，链接: {link}")
-                    if attempt < api_max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    else:
-                        mark_model_rate_limited(current_model)
-                        print(f"✗ 模型 {current_model} 第二次调用仍失败，切换下一个模型")
-                        break  # 尝试下一个模型
-
-                text = getattr(response.choices[0].message, "content", "")
                 if not text:
                     print(f"警告: API返回content为空，链接: {link}")
-                    if attempt < api_max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    else:
-                        mark_model_rate_limited(current_model)
-                        print(f"✗ 模型 {current_model} 第二次调用仍失败，切换下一个模型")
-                        break  # 尝试下一个模型
-
-                text = text.strip()
-                # 移除模型可能输出的 <think>...</think> 思考内容
-                text = re.sub(r"<think>.*?</think>", "", text, flags=re.IGNORECASE | re.DOTALL).strip()
-                # 移除 Markdown 代码块标记
-                text = re.sub(r"```markdown\s*", "", text, flags=re.IGNORECASE)
-                text = re.sub(r"```\s*$", "", text, flags=re.MULTILINE)
-                text = text.strip()
-                # 规范化换行：保留换行符，但规范化空白
-                text = re.sub(r"[ \t]+", " ", text)
-                text = re.sub(r"\n{3,}", "\n\n", text)
-                text = re.sub(r" +\n", "\n", text)
-                # 将换行符转换为 <br> 标签以便在 Markdown 表格中存储
-                text = text.replace("\n", "<br>")
-
-                if not text:
-                    print(f"警告: 处理后文本为空，链接: {link}")
-                    if attempt < api_max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    else:
-                        mark_model_rate_limited(current_model)
-                        print(f"✗ 模型 {current_model} 第二次调用仍失败，切换下一个模型")
-                        break  # 尝试下一个模型
-
-                # 成功生成摘要
-                print(f"✓ 使用模型 {current_model} 成功生成摘要")
-                return text
+                else:
+                    text = clean_summary_text(text)
+                    if not text:
+                        print(f"警告: 处理后文本为空，链接: {link}")
+
+                if text:
+                    # 成功生成摘要
+                    print(f"✓ 使用模型 {current_model} 成功生成摘要")
+                    if cache is not None and is_cacheable_summary(text):
+                        cache.set(SummaryCache.summary_key(current_model, link, source), text)
+                    return text
+
+                if attempt < api_max_retries - 1:
+                    time.sleep(retry_wait_seconds(attempt))
+                    continue
+                mark_model_rate_limited(current_model)
+                print(f"✗ 模型 {current_model} 第二次调用仍失败，切换下一个模型")
+                break  # 尝试下一个模型
 
             except Exception as e:
                 error_msg = str(e).lower()
@@ -294,7 +921,7 @@ def generate_summary_for_link(client: OpenAI, link: str, model: str = None) -> s
                     break  # 直接尝试下一个模型，不重试
                 elif attempt < api_max_retries - 1:
                     print(f"API调用失败，重试 {attempt + 1}/{api_max_retries}: {repr(e)}")
-                    time.sleep(2 ** attempt)
+                    time.sleep(retry_wait_seconds(attempt))
                 else:
                     mark_model_rate_limited(current_model)
                     print(f"✗ 模型 {current_model} 第二次调用仍失败，切换下一个模型: {repr(e)}")
@@ -305,6 +932,165 @@ def generate_summary_for_link(client: OpenAI, link: str, model: str = None) -> s
     return ""
 
 
+def generate_summary_for_link(client: ModelScopeClient, link: str, model: str = None) -> str:
+    """
+    抓取 arXiv HTML 原文（或按 SUMMARY_MODE 使用 arXiv 摘要）并让模型生成简要总结。
+    包含模型回退机制和重试机制。
+    """
+    summary_mode = get_summary_mode()
+    # 先查缓存
+    cache = get_summary_cache()
+    cached_text = get_cached_summary(cache, link, summary_mode, model)
+    if cached_text:
+        return cached_text
+
+    # 获取模型列表，跳过本次运行中已经判定为限流的模型。
+    model_list = get_available_model_list(model)
+    if not model_list:
+        print(f"✗ 所有模型都已被判定为限流，跳过摘要生成: {link}")
+        return ""
+
+    paper_text, source = prepare_paper_text(link, summary_mode, cache)
+    if not paper_text:
+        return ""
+    return summarize_paper_text(client, link, paper_text, source, model_list, cache)
+
+
+def parse_batch_summaries(text: str, keys: List[str]) -> Dict[str, str]:
+    """
+    /**
+     * @function parse_batch_summaries
+     * @description 从批量请求的回复中取出以 arXiv ID 为键的 JSON 对象。键集合必须与请求的论文完全一致、
+     * 值均为字符串，否则整体视为无效并返回空字典（由调用方逐篇重试），避免摘要被对应到错误的论文。
+     */
+    """
+    text = _RE_THINK.sub("", text)
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        data = loads_json(text[start:end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(data, dict) or set(data) != set(keys):
+        return {}
+    if not all(isinstance(value, str) for value in data.values()):
+        return {}
+    return data
+
+
+def summarize_paper_batch(
+    client: ModelScopeClient,
+    papers: List[Tuple[str, str, str]],
+    cache: Optional[SummaryCache],
+) -> Dict[str, str]:
+    """
+    /**
+     * @function summarize_paper_batch
+     * @description 把多篇论文放进同一次模型调用，要求模型返回以 arXiv ID 为键的 JSON 对象，
+     * 摊薄系统提示词与单次请求的开销。只用当前第一个可用模型尝试一次，失败或解析不出的论文由调用方逐篇重试。
+     * @param {List[Tuple[str,str,str]]} papers - (链接, 论文文本, 来源)
+     * @returns {Dict[str,str]} 链接 -> 摘要，只包含成功生成的论文
+     */
+    """
+    model_list = get_available_model_list()
+    if not model_list:
+        return {}
+    current_model = model_list[0]
+    arxiv_ids = [arxiv_id_from_link(link) for link, _, _ in papers]
+    if len(set(arxiv_ids)) != len(arxiv_ids):
+        # ID 重复时无法按键区分各篇论文，直接逐篇生成
+        return {}
+
+    # 所有论文共用一次请求的上下文，按篇数平分字符与 token 预算
+    max_chars = int(os.getenv("HTML_MAX_CHARS", "180000")) // len(papers)
+    max_tokens = int(os.getenv("MAX_INPUT_TOKENS", "60000")) // len(papers)
+    sections = []
+    for index, ((link, paper_text, source), arxiv_id) in enumerate(zip(papers, arxiv_ids), 1):
+        paper_text = truncate_to_token_budget(paper_text[:max_chars], max_tokens)
+        sections.append(f"### Paper {index} ({arxiv_id})\n{USER_PROMPT_PREFIXES[source]}{paper_text}")
+    system_prompt = SUMMARY_SYSTEM_PROMPT + BATCH_SYSTEM_PROMPT_SUFFIX.format(
+        count=len(papers), ids=", ".join(arxiv_ids)
+    )
+    user_content = "\n\n".join(sections)
+
+    print(f"尝试使用模型 {current_model} 批量生成 {len(papers)} 篇摘要")
+    try:
+        acquire_rate_limit(system_prompt, user_content)
+        text = client.create_completion(
+            model=current_model,
+            messages=[
+                {
+                    'role': 'system',
+                    'content': system_prompt,
+                },
+                {
+                    'role': 'user',
+                    'content': user_content,
+                },
+            ],
+        )
+    except Exception as e:
+        print(f"批量生成失败，改为逐篇生成: {repr(e)}")
+        return {}
+
+    summaries = parse_batch_summaries(text, arxiv_ids)
+    if not summaries:
+        print("警告: 批量生成的回复无法解析，或论文 ID 与请求不一致，改为逐篇生成")
+        return {}
+
+    results: Dict[str, str] = {}
+    for (link, _, source), arxiv_id in zip(papers, arxiv_ids):
+        summary = summaries[arxiv_id]
+        summary = clean_summary_text(summary) if summary else ""
+        if summary:
+            results[link] = summary
+            if cache is not None and is_cacheable_summary(summary):
+                cache.set(SummaryCache.summary_key(current_model, link, source), summary)
+    print(f"✓ 使用模型 {current_model} 批量生成摘要 {len(results)}/{len(papers)} 篇")
+    return results
+
+
+def generate_summaries_for_links(client: ModelScopeClient, links: List[str]) -> Dict[str, str]:
+    """
+    /**
+     * @function generate_summaries_for_links
+     * @description 为一组链接生成摘要。只有一个链接时等同于 generate_summary_for_link；
+     * 多个链接时先查缓存并抓取文本，再合并为一次批量调用，批量结果中缺失的论文逐篇重试。
+     * @returns {Dict[str,str]} 链接 -> 摘要（失败为空字符串）
+     */
+    """
+    if len(links) == 1:
+        return {links[0]: generate_summary_for_link(client, links[0])}
+
+    summary_mode = get_summary_mode()
+    cache = get_summary_cache()
+    results: Dict[str, str] = {}
+    pending: List[Tuple[str, str, str]] = []
+    for link in links:
+        cached_text = get_cached_summary(cache, link, summary_mode)
+        if cached_text:
+            results[link] = cached_text
+        elif not get_available_model_list():
+            print(f"✗ 所有模型都已被判定为限流，跳过摘要生成: {link}")
+            results[link] = ""
+        else:
+            paper_text, source = prepare_paper_text(link, summary_mode, cache)
+            if paper_text:
+                pending.append((link, paper_text, source))
+            else:
+                results[link] = ""
+
+    if len(pending) > 1:
+        results.update(summarize_paper_batch(client, pending, cache))
+    for link, paper_text, source in pending:
+        if link not in results:
+            # 沿用单篇的模型回退与重试逻辑，使用未按批次平分预算的完整文本
+            results[link] = summarize_paper_text(client, link, paper_text, source, get_available_model_list(), cache)
+    return results
+
+
 def default_summary_cell() -> str:
     """
     /**
@@ -325,11 +1111,80 @@ def wrap_in_details(summary_text: str) -> str:
     return f"<details><summary>展开</summary>{summary_text}</details>"
 
 
+def find_placeholder_rows(text: str, body_start: int) -> List[Tuple[int, int, str, str, str]]:
+    """
+    /**
+     * @function find_placeholder_rows
+     * @description 只定位含“待生成”的行并解析，不逐行拆分整个文件。
+     * @returns {List[Tuple[int,int,str,str,str]]} (行起始偏移, 行结束偏移（含换行符）, 日期, 标题, 链接)，按文件顺序
+     */
+    """
+    rows: List[Tuple[int, int, str, str, str]] = []
+    position = text.find("待生成", body_start)
+    while position != -1:
+        line_start = max(text.rfind("\n", 0, position) + 1, body_start)
+        line_end = text.find("\n", position)
+        line_end = len(text) if line_end == -1 else line_end + 1
+        line = text[line_start:line_end]
+        if line.strip().startswith("|"):
+            cells = parse_table_line(line)
+            if cells is not None and is_placeholder_summary(cells[3]):
+                rows.append((line_start, line_end, cells[0], cells[1], cells[2]))
+        position = text.find("待生成", line_end)
+    return rows
+
+
+def splice_rows(text: str, updated_rows: Dict[int, Tuple[int, str]]) -> Iterator[str]:
+    """
+    /**
+     * @function splice_rows
+     * @description 按文件顺序依次产出原文片段与新行，由调用方直接流式写入文件，
+     * 不再拼接出整份文档的副本。
+     * @param {Dict[int, Tuple[int, str]]} updated_rows - 行起始偏移 -> (行结束偏移, 新行)
+     */
+    """
+    position = 0
+    for line_start in sorted(updated_rows):
+        line_end, new_line = updated_rows[line_start]
+        yield text[position:line_start]
+        yield new_line
+        position = line_end
+    yield text[position:]
+
+
+def write_papers_md(papers_md: str, pieces: Iterable[str]) -> None:
+    """
+    /**
+     * @function write_papers_md
+     * @description 先写入同目录临时文件并落盘，再用 os.replace 原子替换 `papers.md`；
+     * 写入中途失败或进程被终止时，原文件保持完整。
+     * @param {Iterable[str]} pieces - 按顺序写入的文本片段
+     */
+    """
+    papers_dir = os.path.dirname(os.path.abspath(papers_md))
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=papers_dir, prefix=".papers.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = tmp.name
+            tmp.writelines(pieces)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        shutil.copymode(papers_md, tmp_path)
+        os.replace(tmp_path, papers_md)
+    except Exception:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def update_papers_md() -> Tuple[int, int]:
     """
     /**
      * @function update_papers_md
      * @description 读取 `papers.md`，为缺失摘要的条目生成并写回。
+     * 并发数由环境变量 SUMMARY_CONCURRENCY 控制（默认 1，即逐篇处理）。
      * @returns {Tuple[int,int]} (总需更新数, 实际更新成功数)
      */
     """
@@ -338,66 +1193,81 @@ def update_papers_md() -> Tuple[int, int]:
         raise FileNotFoundError(f"未找到 {papers_md}，请先运行爬取初始化")
 
     with open(papers_md, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+        text = f.read()
 
-    if len(lines) < 2:
+    # 前两行为表头与分隔行；整个文件只读一次，不拆成逐行列表
+    first_break = text.find("\n")
+    if first_break == -1 or first_break == len(text) - 1:
         return 0, 0
-
-    header = lines[:2]
-    body = lines[2:]
+    second_break = text.find("\n", first_break + 1)
+    body_start = len(text) if second_break == -1 else second_break + 1
 
     client = get_client()
 
-    entries_to_update: List[Tuple[int, str, str, str]] = []
-    for idx, line in enumerate(body):
-        if not line.strip().startswith("|"):
-            continue
-        cells = parse_table_line(line)
-        if len(cells) != 4:
-            continue
-        date_str, title, link, summary_cell = cells
-        if not is_placeholder_summary(summary_cell):
-            continue
-        entries_to_update.append((idx, date_str, title, link))
+    entries_to_update = find_placeholder_rows(text, body_start)
+    # 已生成摘要的行：行起始偏移 -> (行结束偏移, 新行)
+    updated_rows: Dict[int, Tuple[int, str]] = {}
 
     need_count = len(entries_to_update)
     success_count = 0
     batch_size = int(os.getenv("BATCH_WRITE_SIZE", "5"))
+    # 抓取 HTML 与调用模型都是网络等待，多篇论文并发处理；结果回到主线程后再统一更新与写文件
+    concurrency = max(1, int(os.getenv("SUMMARY_CONCURRENCY", "1")))
     updates_since_last_write = 0
 
-    progress_bar = tqdm(entries_to_update, desc="生成简要总结", unit="篇")
+    # 同一链接可能出现在多行（跨日期重复收录等），按链接合并后只抓取、生成一次，结果写回所有对应行
+    rows_by_link: Dict[str, List[Tuple[int, int, str, str]]] = {}
+    for line_start, line_end, date_str, title, link in entries_to_update:
+        rows_by_link.setdefault(link, []).append((line_start, line_end, date_str, title))
 
-    for idx, date_str, title, link in progress_bar:
-        try:
-            summary_text = generate_summary_for_link(client, link)
-            if not summary_text:
-                print(f"警告: 生成摘要为空，跳过: {link}")
+    # BATCH_LLM_SIZE > 1 时每次模型调用合并多篇论文
+    batch_llm_size = max(1, int(os.getenv("BATCH_LLM_SIZE", "1")))
+    links = list(rows_by_link)
+    link_batches = [links[i:i + batch_llm_size] for i in range(0, len(links), batch_llm_size)]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(generate_summaries_for_links, client, batch): batch for batch in link_batches}
+        # 按完成顺序推进进度；限制最短刷新间隔，并发完成大量论文时不必每篇都重绘
+        progress_bar = tqdm(total=len(links), desc="生成简要总结", unit="篇", mininterval=0.5)
+
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                summaries = future.result()
+            except Exception as e:
+                print(f"生成摘要失败: {', '.join(batch)}: {repr(e)}")
+                progress_bar.update(len(batch))
                 continue
-            new_summary_cell = wrap_in_details(summary_text)
-            new_line = rebuild_line(date_str, title, link, new_summary_cell)
-            # 更新内存中的行
-            body[idx] = new_line
-            success_count += 1
-            updates_since_last_write += 1
-            progress_bar.set_postfix({"成功": success_count})
+
+            for link in batch:
+                summary_text = summaries.get(link, "")
+                if not summary_text:
+                    print(f"警告: 生成摘要为空，跳过: {link}")
+                    continue
+                new_summary_cell = wrap_in_details(summary_text)
+                for line_start, line_end, date_str, title in rows_by_link[link]:
+                    # 记录替换内容，写文件时再拼接
+                    updated_rows[line_start] = (line_end, rebuild_line(date_str, title, link, new_summary_cell))
+                    success_count += 1
+                    updates_since_last_write += 1
+            # 先更新后缀但不单独刷新，随 update 按刷新间隔一起重绘
+            progress_bar.set_postfix({"成功": success_count}, refresh=False)
+            progress_bar.update(len(batch))
 
             # 批量写入：每处理 batch_size 篇就写一次文件
             if updates_since_last_write >= batch_size:
                 try:
-                    with open(papers_md, "w", encoding="utf-8") as f:
-                        f.writelines(header + body)
+                    write_papers_md(papers_md, splice_rows(text, updated_rows))
                     updates_since_last_write = 0
                 except Exception as e:
                     print(f"警告: 写入文件失败: {repr(e)}")
 
-        except Exception as e:
-            print(f"生成摘要失败: {link}: {repr(e)}")
+        progress_bar.close()
 
     # 最后写入一次，确保所有更改都保存
     if updates_since_last_write > 0:
         try:
-            with open(papers_md, "w", encoding="utf-8") as f:
-                f.writelines(header + body)
+            write_papers_md(papers_md, splice_rows(text, updated_rows))
         except Exception as e:
             print(f"错误: 最终写入文件失败: {repr(e)}")
             raise